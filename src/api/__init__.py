@@ -17,11 +17,15 @@ from .docker_api import router as docker_router
 
 router = APIRouter()
 
+HEALTH_PAYLOAD = {"healthy": True, "status": "healthy", "service": "graphiti-ui"}
+
+
 # Health check (no auth required)
+# Normally answered by HealthCheckMiddleware in main.py; kept for OpenAPI docs.
 @router.get("/health")
 async def health_check() -> dict:
     """Health check endpoint."""
-    return {"healthy": True, "status": "healthy", "service": "graphiti-ui"}
+    return HEALTH_PAYLOAD
 
 
 # Include sub-routers
@@ -9,10 +9,13 @@ Configuration is read-only from environment variables.
 To change settings, edit .env or docker-compose.yml and restart the stack.
 """
 
+import json
+from functools import lru_cache
 from typing import Any
 
 import httpx
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
+from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 
 from ..auth.dependencies import CurrentUser
@@ -21,9 +24,27 @@ from ..services.credentials_service import (
     get_llm_credentials,
     get_embedder_credentials,
 )
+from .dashboard import (
+    STATUS_CACHE_CONTROL,
+    ProbeCache,
+    auth_headers,
+    expand_env_vars,
+    is_model_available,
+    probe_cache_key,
+    probe_get,
+)
 
 router = APIRouter()
 
+# Short-lived, single-flight cache for model availability probes
+_probe_cache = ProbeCache()
+
+# Expanded provider configs per section, tied to the config dict they came from
+_provider_config_cache: dict[str, tuple[dict[str, Any], dict[str, Any]]] = {}
+
+# Serialized masked /config response, tied to the config dict it was built from
+_masked_config_cache: tuple[dict[str, Any], bytes] | None = None
+
 
 # ============================================
 # Configuration Models
@@ -81,11 +102,20 @@ def _get_provider_config(section: str) -> dict[str, str]:
     config.yaml doesn't have the section.
     """
     config = read_config()
+    cached = _provider_config_cache.get(section)
+    if cached and cached[0] is config:
+        return cached[1]
+
+    result = _build_provider_config(config, section)
+    _provider_config_cache[section] = (config, result)
+    return result
+
+
+def _build_provider_config(config: dict[str, Any], section: str) -> dict[str, str]:
+    """Extract and expand provider config for a section (uncached)."""
     section_config = config.get(section, {})
 
     if section_config and "providers" in section_config:
-        from .dashboard import expand_env_vars
-
         provider = section_config.get("provider", "openai")
         model = expand_env_vars(section_config.get("model", ""))
         provider_config = section_config.get("providers", {}).get(provider, {})
@@ -116,13 +146,16 @@ def _get_provider_config(section: str) -> dict[str, str]:
 
 
 async def _check_model_availability(
-    api_url: str, api_key: str, model: str, provider: str = "openai"
+    client: httpx.AsyncClient, api_url: str, api_key: str, model: str, provider: str = "openai"
 ) -> dict[str, Any]:
     """Check model availability at an API endpoint.
 
     For OpenAI-compatible APIs: queries /models to verify the model exists.
     For Anthropic-compatible APIs: performs a connectivity check (no /models endpoint).
 
+    Results are cached for PROBE_CACHE_TTL seconds and concurrent identical
+    probes share a single upstream request.
+
     Returns dict with reachable, model_available, available_models, error.
     """
     if not api_url:
@@ -133,50 +166,54 @@ async def _check_model_availability(
             "error": "API URL not configured",
         }
 
+    return await _probe_cache.get_or_fetch(
+        probe_cache_key(api_url, api_key, model, provider),
+        lambda: _fetch_model_availability(client, api_url, api_key, model, provider),
+    )
+
+
+async def _fetch_model_availability(
+    client: httpx.AsyncClient, api_url: str, api_key: str, model: str, provider: str
+) -> dict[str, Any]:
+    """Query the API endpoint for model availability (uncached)."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            headers = {}
-            if api_key:
-                headers["Authorization"] = f"Bearer {api_key}"
-
-            # Anthropic-compatible APIs don't have a /models endpoint
-            if provider == "anthropic":
-                base_url = api_url.rstrip("/")
-                if base_url.endswith("/v1"):
-                    base_url = base_url[:-3]
-                response = await client.get(base_url, headers=headers)
-                # Any response (even 4xx) means the API is reachable
-                return {
-                    "reachable": True,
-                    "model_available": True,
-                    "available_models": [model],
-                    "error": None,
-                }
-
-            # OpenAI-compatible: query /models endpoint
-            response = await client.get(f"{api_url}/models", headers=headers)
-            reachable = response.status_code == 200
-            if reachable:
-                data = response.json()
-                models = data.get("data", [])
-                available_models = [m.get("id", "") for m in models]
-                model_available = any(
-                    model == mid or mid.startswith(f"{model}:")
-                    for mid in available_models
-                )
-                error = None if model_available else f"Model '{model}' not found in available models"
-                return {
-                    "reachable": True,
-                    "model_available": model_available,
-                    "available_models": available_models,
-                    "error": error,
-                }
+        headers = auth_headers(api_key)
+
+        # Anthropic-compatible APIs don't have a /models endpoint
+        if provider == "anthropic":
+            base_url = api_url.rstrip("/")
+            if base_url.endswith("/v1"):
+                base_url = base_url[:-3]
+            response = await probe_get(client, base_url, headers)
+            # Any response (even 4xx) means the API is reachable
+            return {
+                "reachable": True,
+                "model_available": True,
+                "available_models": [model],
+                "error": None,
+            }
+
+        # OpenAI-compatible: query /models endpoint
+        response = await probe_get(client, f"{api_url}/models", headers)
+        reachable = response.status_code == 200
+        if reachable:
+            data = response.json()
+            models = data.get("data", [])
+            available_models = [m.get("id", "") for m in models]
+            model_available = is_model_available(model, available_models)
+            error = None if model_available else f"Model '{model}' not found in available models"
             return {
-                "reachable": False,
-                "model_available": False,
-                "available_models": [],
-                "error": f"HTTP {response.status_code}",
+                "reachable": True,
+                "model_available": model_available,
+                "available_models": available_models,
+                "error": error,
             }
+        return {
+            "reachable": False,
+            "model_available": False,
+            "available_models": [],
+            "error": f"HTTP {response.status_code}",
+        }
     except httpx.TimeoutException:
         return {
             "reachable": False,
@@ -198,18 +235,26 @@ async def _check_model_availability(
 # ============================================
 
 
-@router.get("/llm", response_model=LLMConfigResponse)
-async def get_llm_config(current_user: CurrentUser) -> LLMConfigResponse:
-    """Get current LLM configuration (from environment variables)."""
+@lru_cache(maxsize=1)
+def _llm_config_json() -> bytes:
+    """Serialized LLM config response (env vars don't change at runtime)."""
     creds = get_llm_credentials()
     return LLMConfigResponse(
         api_url=creds.get("api_url", ""),
         model=creds.get("model", ""),
-    )
+    ).model_dump_json().encode()
+
+
+@router.get("/llm", response_model=LLMConfigResponse)
+async def get_llm_config(current_user: CurrentUser) -> Response:
+    """Get current LLM configuration (from environment variables)."""
+    return Response(content=_llm_config_json(), media_type="application/json")
 
 
 @router.get("/llm/status", response_model=LLMStatusResponse)
-async def get_llm_status(current_user: CurrentUser) -> LLMStatusResponse:
+async def get_llm_status(
+    request: Request, response: Response, current_user: CurrentUser
+) -> LLMStatusResponse:
     """Get LLM configuration with connectivity and model availability status.
 
     Reads from config.yaml (preferred) or falls back to environment variables.
@@ -217,8 +262,13 @@ async def get_llm_status(current_user: CurrentUser) -> LLMStatusResponse:
     cfg = _get_provider_config("llm")
 
     status = await _check_model_availability(
-        cfg["api_url"], cfg["api_key"], cfg["model"], provider=cfg["provider"]
+        request.app.state.http_client,
+        cfg["api_url"],
+        cfg["api_key"],
+        cfg["model"],
+        provider=cfg["provider"],
     )
+    response.headers["Cache-Control"] = STATUS_CACHE_CONTROL
 
     return LLMStatusResponse(
         api_url=cfg["api_url"],
@@ -235,19 +285,27 @@ async def get_llm_status(current_user: CurrentUser) -> LLMStatusResponse:
 # ============================================
 
 
-@router.get("/embedder", response_model=EmbedderConfigResponse)
-async def get_embedder_config(current_user: CurrentUser) -> EmbedderConfigResponse:
-    """Get current embedder configuration (from environment variables)."""
+@lru_cache(maxsize=1)
+def _embedder_config_json() -> bytes:
+    """Serialized embedder config response (env vars don't change at runtime)."""
     creds = get_embedder_credentials()
     return EmbedderConfigResponse(
         api_url=creds.get("api_url", ""),
         model=creds.get("model", ""),
         dimensions=creds.get("dimensions", 768),
-    )
+    ).model_dump_json().encode()
+
+
+@router.get("/embedder", response_model=EmbedderConfigResponse)
+async def get_embedder_config(current_user: CurrentUser) -> Response:
+    """Get current embedder configuration (from environment variables)."""
+    return Response(content=_embedder_config_json(), media_type="application/json")
 
 
 @router.get("/embedder/status", response_model=EmbedderStatusResponse)
-async def get_embedder_status(current_user: CurrentUser) -> EmbedderStatusResponse:
+async def get_embedder_status(
+    request: Request, response: Response, current_user: CurrentUser
+) -> EmbedderStatusResponse:
     """Get Embedder configuration with connectivity and model availability status.
 
     Reads from config.yaml (preferred) or falls back to environment variables.
@@ -255,8 +313,13 @@ async def get_embedder_status(current_user: CurrentUser) -> EmbedderStatusRespon
     cfg = _get_provider_config("embedder")
 
     status = await _check_model_availability(
-        cfg["api_url"], cfg["api_key"], cfg["model"], provider=cfg["provider"]
+        request.app.state.http_client,
+        cfg["api_url"],
+        cfg["api_key"],
+        cfg["model"],
+        provider=cfg["provider"],
     )
+    response.headers["Cache-Control"] = STATUS_CACHE_CONTROL
 
     return EmbedderStatusResponse(
         api_url=cfg["api_url"],
@@ -274,22 +337,53 @@ async def get_embedder_status(current_user: CurrentUser) -> EmbedderStatusRespon
 # ============================================
 
 
-@router.get("")
-async def get_full_config(current_user: CurrentUser) -> dict:
-    """Get full configuration from config.yaml (masked)."""
-    config = read_config()
+def _is_env_placeholder(value: Any) -> bool:
+    """Check if a config value is an unexpanded ${VAR} reference (safe to show)."""
+    return str(value).startswith("${")
+
+
+def _mask_providers(providers: dict[str, Any]) -> dict[str, Any]:
+    """Copy a providers mapping with literal API keys replaced by ***."""
+    masked = {}
+    for name, provider in providers.items():
+        if (
+            isinstance(provider, dict)
+            and "api_key" in provider
+            and not _is_env_placeholder(provider["api_key"])
+        ):
+            provider = {**provider, "api_key": "***"}
+        masked[name] = provider
+    return masked
+
+
+def _mask_config(config: dict[str, Any]) -> dict[str, Any]:
+    """Return a masked view of the config.
+
+    Only the dicts on the path to an api_key are copied; everything else is
+    shared with the (read-only) cached config.
+    """
+    masked = dict(config)
+    for section in ("llm", "embedder"):
+        section_config = config.get(section)
+        if isinstance(section_config, dict) and "providers" in section_config:
+            masked[section] = {
+                **section_config,
+                "providers": _mask_providers(section_config["providers"]),
+            }
+    return masked
+
 
-    # Mask sensitive values
-    if "llm" in config and "providers" in config["llm"]:
-        for provider in config["llm"]["providers"].values():
-            if isinstance(provider, dict) and "api_key" in provider:
-                if not str(provider["api_key"]).startswith("${"):
-                    provider["api_key"] = "***"
+@router.get("")
+async def get_full_config(current_user: CurrentUser) -> Response:
+    """Get full configuration from config.yaml (masked).
 
-    if "embedder" in config and "providers" in config["embedder"]:
-        for provider in config["embedder"]["providers"].values():
-            if isinstance(provider, dict) and "api_key" in provider:
-                if not str(provider["api_key"]).startswith("${"):
-                    provider["api_key"] = "***"
+    The serialized masked view is cached for as long as read_config() returns
+    the same dict.
+    """
+    global _masked_config_cache
+    config = read_config()
+    if _masked_config_cache is None or _masked_config_cache[0] is not config:
+        body = json.dumps(jsonable_encoder({"config": _mask_config(config)})).encode()
+        _masked_config_cache = (config, body)
 
-    return {"config": config}
+    return Response(content=_masked_config_cache[1], media_type="application/json")
@@ -5,20 +5,77 @@
 
 """Dashboard API routes."""
 
+import asyncio
+import hashlib
 import os
 import re
+from collections.abc import Awaitable, Callable, Mapping
 from typing import Any
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 import httpx
 
 from ..auth.dependencies import CurrentUser
 from ..config import get_settings
+from ..services.cache_service import SingleFlight, TTLCache
 from ..services.config_service import read_config
 from ..services.graphiti_service import get_graphiti_client
 
 router = APIRouter()
 
+# Model availability probes are cached briefly so that dashboard polling
+# doesn't hit the LLM/embedder /models endpoints on every refresh.
+PROBE_CACHE_TTL = 10.0
+
+ProbeKey = tuple[str, str, str, str]
+
+
+class ProbeCache:
+    """TTL cache for model probes that also coalesces concurrent identical probes.
+
+    While a probe for a key is in flight, other callers await the same task
+    instead of sending their own request upstream.
+    """
+
+    def __init__(self, ttl: float = PROBE_CACHE_TTL) -> None:
+        self._results: TTLCache[ProbeKey, dict[str, Any]] = TTLCache(ttl=ttl)
+        self._inflight: SingleFlight[ProbeKey, dict[str, Any]] = SingleFlight()
+
+    async def get_or_fetch(
+        self, key: ProbeKey, fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        """Return a fresh cached result, join an in-flight probe, or start one."""
+        cached = self._results.get(key)
+        if cached is not None:
+            return cached
+        return await self._inflight.run(key, lambda: self._fetch_and_store(key, fetch))
+
+    async def _fetch_and_store(
+        self, key: ProbeKey, fetch: Callable[[], Awaitable[dict[str, Any]]]
+    ) -> dict[str, Any]:
+        result = await fetch()
+        self._results.set(key, result)
+        return result
+
+
+_probe_cache = ProbeCache()
+
+# Status data may be slightly stale; let browsers reuse it while revalidating
+STATUS_CACHE_CONTROL = "max-age=5, stale-while-revalidate=30, stale-if-error=60"
+
+
+# Expanded provider configs per section, tied to the config dict they came from
+_provider_config_cache: dict[str, tuple[dict[str, Any], dict[str, str]]] = {}
+
+# ${VAR} / ${VAR:default} placeholders used in config.yaml
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}:]+)(?::([^}]*))?\}')
+_environ_get = os.environ.get
+
+
+def _replace_env_var(match: re.Match) -> str:
+    """Substitute a single ${VAR[:default]} match."""
+    return _environ_get(match.group(1), match.group(2) or "")
+
 
 def expand_env_vars(value: str) -> str:
     """Expand environment variables in a string.
@@ -28,18 +85,18 @@ def expand_env_vars(value: str) -> str:
     if not isinstance(value, str):
         return value
 
-    pattern = r'\$\{([^}:]+)(?::([^}]*))?\}'
+    return _ENV_VAR_PATTERN.sub(_replace_env_var, value)
 
-    def replacer(match: re.Match) -> str:
-        var_name = match.group(1)
-        default = match.group(2) or ""
-        return os.environ.get(var_name, default)
 
-    return re.sub(pattern, replacer, value)
+def _get_provider_config(config: dict[str, Any], section: str) -> dict[str, str]:
+    """Extract and expand provider configuration for a given section (llm or embedder).
 
+    Cached per section for as long as read_config() returns the same object.
+    """
+    cached = _provider_config_cache.get(section)
+    if cached and cached[0] is config:
+        return cached[1]
 
-def _get_provider_config(config: dict[str, Any], section: str) -> dict[str, str]:
-    """Extract and expand provider configuration for a given section (llm or embedder)."""
     section_config = config.get(section, {})
     provider = section_config.get("provider", "openai")
     model = expand_env_vars(section_config.get("model", ""))
@@ -50,12 +107,14 @@ def _get_provider_config(config: dict[str, Any], section: str) -> dict[str, str]
     api_url = expand_env_vars(provider_config.get("api_url", ""))
     api_key = expand_env_vars(provider_config.get("api_key", ""))
 
-    return {
+    result = {
         "provider": provider,
         "model": model,
         "api_url": api_url,
         "api_key": api_key,
     }
+    _provider_config_cache[section] = (config, result)
+    return result
 
 
 def get_llm_config(config: dict[str, Any]) -> dict[str, str]:
@@ -101,7 +160,46 @@ async def get_dashboard_stats(current_user: CurrentUser) -> dict:
         }
 
 
+def is_model_available(model_name: str, model_ids: list[str]) -> bool:
+    """Check if a model is in the list of available model IDs.
+
+    Handles both exact match and tag match (e.g., "llama3" vs "llama3:latest").
+    """
+    ids = set(model_ids)
+    if model_name in ids:
+        return True
+    prefix = f"{model_name}:"
+    return any(mid.startswith(prefix) for mid in ids)
+
+
+def auth_headers(api_key: str) -> dict[str, str]:
+    """Build the Authorization header for an API key.
+
+    Built per call rather than cached, so the raw key isn't kept in cache state.
+    """
+    if not api_key:
+        return {}
+    return {"Authorization": f"Bearer {api_key}"}
+
+
+async def probe_get(
+    client: httpx.AsyncClient, url: str, headers: Mapping[str, str]
+) -> httpx.Response:
+    """GET a probe URL, retrying once on connection errors and read timeouts."""
+    try:
+        return await client.get(url, headers=headers)
+    except (httpx.ConnectError, httpx.ReadTimeout):
+        return await client.get(url, headers=headers)
+
+
+def probe_cache_key(api_url: str, api_key: str, model_name: str, provider: str) -> ProbeKey:
+    """Build a probe cache key without keeping the raw API key in memory."""
+    key_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest() if api_key else ""
+    return (api_url, key_hash, model_name, provider)
+
+
 async def check_model_availability(
+    client: httpx.AsyncClient,
     api_url: str,
     api_key: str,
     model_name: str,
@@ -112,64 +210,75 @@ async def check_model_availability(
     For OpenAI-compatible APIs (openai, ollama): queries /models to verify the model exists.
     For Anthropic-compatible APIs: performs a connectivity check since there is no /models endpoint.
 
+    Results are cached for PROBE_CACHE_TTL seconds and concurrent identical
+    probes share a single upstream request.
+
     Returns dict with status, available models, and error message if any.
     """
     if not api_url:
         return {"status": "unconfigured", "error": "API URL not configured"}
 
-    headers = {}
-    if api_key:
-        headers["Authorization"] = f"Bearer {api_key}"
+    return await _probe_cache.get_or_fetch(
+        probe_cache_key(api_url, api_key, model_name, provider),
+        lambda: _fetch_model_availability(client, api_url, api_key, model_name, provider),
+    )
+
+
+async def _fetch_model_availability(
+    client: httpx.AsyncClient,
+    api_url: str,
+    api_key: str,
+    model_name: str,
+    provider: str,
+) -> dict[str, Any]:
+    """Query the API endpoint for model availability (uncached)."""
+    headers = auth_headers(api_key)
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Anthropic-compatible APIs don't have a /models endpoint.
-            # Check connectivity by making a request to the base URL.
-            if provider == "anthropic":
-                # Try the base URL — any response (even 4xx) means the API is reachable
-                base_url = api_url.rstrip("/")
-                # Strip /v1 suffix if present for the connectivity check
-                if base_url.endswith("/v1"):
-                    base_url = base_url[:-3]
-                response = await client.get(base_url, headers=headers)
-                return {
-                    "status": "healthy",
-                    "model": model_name,
-                }
-
-            # OpenAI-compatible: query /models endpoint
-            response = await client.get(f"{api_url}/models", headers=headers)
-
-            if response.status_code != 200:
-                return {
-                    "status": "error",
-                    "error": f"API returned {response.status_code}",
-                }
-
-            data = response.json()
-            models = data.get("data", [])
-            model_ids = [m.get("id", "") for m in models]
-
-            # Check if configured model exists
-            # Handle both exact match and prefix match (e.g., "llama3" vs "llama3:latest")
-            model_found = any(
-                model_name == mid or mid.startswith(f"{model_name}:")
-                for mid in model_ids
-            )
-
-            if model_found:
-                return {
-                    "status": "healthy",
-                    "model": model_name,
-                    "available_models": model_ids,
-                }
-            else:
-                return {
-                    "status": "model_not_found",
-                    "error": f"Model '{model_name}' not found",
-                    "configured_model": model_name,
-                    "available_models": model_ids,
-                }
+        # Anthropic-compatible APIs don't have a /models endpoint.
+        # Check connectivity by making a request to the base URL.
+        if provider == "anthropic":
+            # Try the base URL — any response (even 4xx) means the API is reachable
+            base_url = api_url.rstrip("/")
+            # Strip /v1 suffix if present for the connectivity check
+            if base_url.endswith("/v1"):
+                base_url = base_url[:-3]
+            response = await probe_get(client, base_url, headers)
+            return {
+                "status": "healthy",
+                "model": model_name,
+            }
+
+        # OpenAI-compatible: query /models endpoint
+        response = await probe_get(client, f"{api_url}/models", headers)
+
+        if response.status_code != 200:
+            return {
+                "status": "error",
+                "error": f"API returned {response.status_code}",
+            }
+
+        data = response.json()
+        models = data.get("data", [])
+        model_ids = [m.get("id", "") for m in models]
+
+        # Check if configured model exists
+        # Handle both exact match and prefix match (e.g., "llama3" vs "llama3:latest")
+        model_found = is_model_available(model_name, model_ids)
+
+        if model_found:
+            return {
+                "status": "healthy",
+                "model": model_name,
+                "available_models": model_ids,
+            }
+        else:
+            return {
+                "status": "model_not_found",
+                "error": f"Model '{model_name}' not found",
+                "configured_model": model_name,
+                "available_models": model_ids,
+            }
 
     except httpx.TimeoutException:
         return {"status": "timeout", "error": "Connection timed out"}
@@ -199,42 +308,31 @@ async def get_queue_status(current_user: CurrentUser) -> dict:
         }
 
 
-@router.get("/status")
-async def get_service_status(current_user: CurrentUser) -> dict:
-    """Get status of all services."""
-    settings = get_settings()
-    config = read_config()
-
-    # Check graph database via driver's health_check (DB-neutral)
-    from ..services.queue_service import get_queue_service
-
-    graphiti_status = "unknown"
+async def _probe_graphiti() -> str:
+    """Check graph database via driver's health_check (DB-neutral)."""
     try:
         client = get_graphiti_client()
         health = await client.health_check()
-        graphiti_status = "healthy" if health.get("healthy") else "unreachable"
+        return "healthy" if health.get("healthy") else "unreachable"
     except Exception:
-        graphiti_status = "unreachable"
+        return "unreachable"
 
-    # Check LLM
-    llm_config = get_llm_config(config)
-    llm_check = await check_model_availability(
-        llm_config["api_url"],
-        llm_config["api_key"],
-        llm_config["model"],
-        provider=llm_config["provider"],
-    )
 
-    # Check Embedder
-    embedder_config = get_embedder_config(config)
-    embedder_check = await check_model_availability(
-        embedder_config["api_url"],
-        embedder_config["api_key"],
-        embedder_config["model"],
-        provider=embedder_config["provider"],
+async def _probe_model(client: httpx.AsyncClient, provider_config: dict[str, str]) -> dict[str, Any]:
+    """Check model availability for an extracted LLM/embedder provider config."""
+    return await check_model_availability(
+        client,
+        provider_config["api_url"],
+        provider_config["api_key"],
+        provider_config["model"],
+        provider=provider_config["provider"],
     )
 
-    # Check queue status via MCP
+
+async def _probe_queue() -> dict[str, Any]:
+    """Check queue status via MCP."""
+    from ..services.queue_service import get_queue_service
+
     queue_status = {"total_pending": 0, "currently_processing": 0, "error": None}
     try:
         queue_service = get_queue_service()
@@ -243,6 +341,44 @@ async def get_service_status(current_user: CurrentUser) -> dict:
         queue_status["currently_processing"] = 1 if status.get("processing", False) else 0
     except Exception as e:
         queue_status["error"] = str(e)
+    return queue_status
+
+
+@router.get("/status")
+async def get_service_status(
+    request: Request, response: Response, current_user: CurrentUser
+) -> dict:
+    """Get status of all services.
+
+    All probes run concurrently, so the response time is bounded by the
+    slowest backend instead of the sum of all of them.
+    """
+    settings = get_settings()
+    config = read_config()
+    http_client = request.app.state.http_client
+
+    llm_config = get_llm_config(config)
+    embedder_config = get_embedder_config(config)
+
+    graphiti_status, llm_check, embedder_check, queue_status = await asyncio.gather(
+        _probe_graphiti(),
+        _probe_model(http_client, llm_config),
+        _probe_model(http_client, embedder_config),
+        _probe_queue(),
+        return_exceptions=True,
+    )
+
+    # Probes handle their own errors; guard against anything unexpected
+    if isinstance(graphiti_status, BaseException):
+        graphiti_status = "unreachable"
+    if isinstance(llm_check, BaseException):
+        llm_check = {"status": "error", "error": str(llm_check)}
+    if isinstance(embedder_check, BaseException):
+        embedder_check = {"status": "error", "error": str(embedder_check)}
+    if isinstance(queue_status, BaseException):
+        queue_status = {"total_pending": 0, "currently_processing": 0, "error": str(queue_status)}
+
+    response.headers["Cache-Control"] = STATUS_CACHE_CONTROL
 
     return {
         "graphiti_mcp": {
@@ -0,0 +1,21 @@
+# Graphiti UI — Admin interface for Graphiti Knowledge Graph
+# Copyright (c) 2026 Matthias Brusdeylins
+# SPDX-License-Identifier: MIT
+# 100% AI-generated code (vibe-coding with Claude)
+
+"""Shared API route dependencies."""
+
+from typing import Annotated
+
+from fastapi import Depends, Request
+
+from ..services.graphiti_service import GraphitiClient
+
+
+def get_graphiti(request: Request) -> GraphitiClient:
+    """Get the Graphiti client bound to the app in the lifespan handler."""
+    return request.app.state.graphiti_client
+
+
+# Dependency type alias
+GraphitiDep = Annotated[GraphitiClient, Depends(get_graphiti)]
@@ -6,9 +6,10 @@
 """Entity Types API routes - proxies to MCP server."""
 
 from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 from ..auth.dependencies import CurrentUser
+from ..services.entity_type_service import EntityType as ServiceEntityType
 from ..services.entity_type_service import get_entity_type_service
 
 router = APIRouter()
@@ -49,22 +50,28 @@ class EntityTypeUpdate(BaseModel):
     fields: list[EntityTypeField] | None = Field(default=None, description="Structured fields")
 
 
+def _to_entity_type(et: ServiceEntityType) -> EntityType:
+    """Convert a service entity type to the response model."""
+    return EntityType(
+        name=et.name,
+        description=et.description,
+        fields=[EntityTypeField(**f) for f in et.fields],
+        source=et.source,
+        created_at=et.created_at,
+        modified_at=et.modified_at,
+    )
+
+
+# Validates the whole list in one pass instead of one model call per item
+_ENTITY_TYPE_LIST_ADAPTER = TypeAdapter(list[EntityType])
+
+
 @router.get("")
 async def list_entity_types(current_user: CurrentUser) -> list[EntityType]:
     """List all entity types from MCP server."""
     service = get_entity_type_service()
     entity_types = await service.get_all()
-    return [
-        EntityType(
-            name=et.name,
-            description=et.description,
-            fields=[EntityTypeField(**f) for f in et.fields],
-            source=et.source,
-            created_at=et.created_at,
-            modified_at=et.modified_at,
-        )
-        for et in entity_types
-    ]
+    return _ENTITY_TYPE_LIST_ADAPTER.validate_python([et.to_dict() for et in entity_types])
 
 
 @router.post("", response_model=EntityType)
@@ -80,14 +87,7 @@ async def create_entity_type(
             description=entity_type.description,
             fields=[f.model_dump() for f in entity_type.fields],
         )
-        return EntityType(
-            name=et.name,
-            description=et.description,
-            fields=[EntityTypeField(**f) for f in et.fields],
-            source=et.source,
-            created_at=et.created_at,
-            modified_at=et.modified_at,
-        )
+        return _to_entity_type(et)
     except ValueError as e:
         raise HTTPException(status_code=409, detail=str(e))
 
@@ -114,14 +114,7 @@ async def get_entity_type(name: str, current_user: CurrentUser) -> EntityType:
     et = await service.get_by_name(name)
     if not et:
         raise HTTPException(status_code=404, detail=f"Entity type '{name}' not found")
-    return EntityType(
-        name=et.name,
-        description=et.description,
-        fields=[EntityTypeField(**f) for f in et.fields],
-        source=et.source,
-        created_at=et.created_at,
-        modified_at=et.modified_at,
-    )
+    return _to_entity_type(et)
 
 
 @router.put("/{name}", response_model=EntityType)
@@ -143,14 +136,7 @@ async def update_entity_type(
     if not et:
         raise HTTPException(status_code=404, detail=f"Entity type '{name}' not found")
 
-    return EntityType(
-        name=et.name,
-        description=et.description,
-        fields=[EntityTypeField(**f) for f in et.fields],
-        source=et.source,
-        created_at=et.created_at,
-        modified_at=et.modified_at,
-    )
+    return _to_entity_type(et)
 
 
 @router.delete("/{name}")
@@ -5,17 +5,111 @@
 
 """Graph API routes for visualization data.
 
-These routes proxy to the Graphiti MCP server which handles the database access.
-This ensures database abstraction (FalkorDB vs Neo4j) is handled by Graphiti.
+Reads and direct edits go straight to the graph database through the
+graphiti_core driver (see GraphitiClient), so no MCP/JSON-RPC hop is involved.
+Only LLM-based operations (/knowledge) are sent to the Graphiti MCP server.
+Database abstraction (FalkorDB vs Neo4j) is still handled by graphiti_core.
 """
 
-from fastapi import APIRouter, Query
-from pydantic import BaseModel
+import hashlib
+import re
+import secrets
+from collections.abc import Iterator
+from typing import Annotated
+from uuid import UUID
+
+import orjson
+import ormsgpack
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field
 
 from ..auth.dependencies import CurrentUser
-from ..services.graphiti_service import get_graphiti_client
+from ..services.cache_service import SingleFlight, TTLCache
+from ..services.graphiti_service import GraphitiClient
+from .dependencies import GraphitiDep
+from .query import invalidate_query_cache
+from .routing import ErrorEnvelopeRoute
+
+# Uncaught errors become {"success": false, "error": ...} responses
+router = APIRouter(route_class=ErrorEnvelopeRoute)
+
+JSON_MEDIA_TYPE = "application/json"
+# Sent instead of JSON when the client asks for it in Accept
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+
+# /data responses, keyed by (group_id, limit, media type). Kept short so edits
+# made outside this UI (MCP clients, LLM ingestion) show up quickly.
+# Small JSON responses and all MessagePack responses are cached as serialized
+# bytes; large JSON ones as the payload dict, which is encoded chunk by chunk
+# while streaming (see below).
+GRAPH_DATA_CACHE_TTL = 5.0
+GraphDataKey = tuple[str | None, int, str]
+# (body, ETag)
+GraphDataBody = tuple[bytes | dict, str]
+_graph_data_cache: TTLCache[GraphDataKey, GraphDataBody] = TTLCache(ttl=GRAPH_DATA_CACHE_TTL)
+# Concurrent cache misses for the same key share one load
+_graph_data_loads: SingleFlight[tuple[GraphDataKey, int], GraphDataBody] = SingleFlight()
+
+# Browsers keep /data, /groups and /stats but revalidate on every use, so an
+# unchanged graph costs a 304 instead of a body. No max-age: the UI refetches
+# right after its own edits and must not get a stale copy.
+GRAPH_CACHE_CONTROL = "private, no-cache"
+
+# /stats results per group_id. Counts are only informational, so they may lag
+# a little longer than /data.
+GRAPH_STATS_CACHE_TTL = 10.0
+_graph_stats_cache: TTLCache[tuple[str | None], dict] = TTLCache(ttl=GRAPH_STATS_CACHE_TTL)
+_graph_stats_loads: SingleFlight[tuple[tuple[str | None], int], dict] = SingleFlight()
+
+# Above this many nodes + edges, /data is streamed instead of encoded in one go
+GRAPH_DATA_STREAM_THRESHOLD = 2000
+# Nodes/edges encoded per streamed chunk
+GRAPH_DATA_STREAM_CHUNK = 512
+
+
+def _etag(content: bytes) -> str:
+    """Weak ETag for a response body (weak: GZipMiddleware may re-encode it)."""
+    return f'W/"{hashlib.blake2b(content, digest_size=8).hexdigest()}"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already names this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def invalidate_graph_cache(group_id: str | None = None) -> None:
+    """Drop cached graph data, stats and query results affected by a change to group_id.
+
+    All graphs are affected if group_id is None.
+    """
+    invalidate_query_cache(group_id)
+    for cache in (_graph_data_cache, _graph_stats_cache):
+        if group_id is None:
+            cache.invalidate()
+        else:
+            # group_id=None (all graphs / default graph) may include this group
+            cache.invalidate(lambda key: key[0] in (group_id, None))
+
+
+class GraphParams(BaseModel):
+    """Query parameters shared by the graph read endpoints."""
+
+    group_id: str | None = Field(default=None, description="Graph/group ID (all graphs if omitted)")
+
 
-router = APIRouter()
+class GraphDataParams(GraphParams):
+    """Query parameters for /data."""
+
+    limit: int = Field(default=500, ge=1, le=10000, description="Max nodes to return")
+
+
+# Query parameter model aliases (validated as one model per request)
+GraphQuery = Annotated[GraphParams, Query()]
+GraphDataQuery = Annotated[GraphDataParams, Query()]
 
 
 class GraphDataResponse(BaseModel):
@@ -24,7 +118,6 @@ class GraphDataResponse(BaseModel):
     success: bool
     nodes: list[dict]
     edges: list[dict]
-    triplets: list[dict]
     labels: list[str]
     stats: dict
     error: str | None = None
@@ -38,197 +131,315 @@ class GroupIdsResponse(BaseModel):
     error: str | None = None
 
 
-@router.get("/data", response_model=GraphDataResponse)
-async def get_graph_data(
-    current_user: CurrentUser,
-    limit: int = Query(default=500, ge=1, le=10000, description="Max nodes to return"),
-    group_id: str | None = Query(default=None, description="Filter by group ID"),
-) -> GraphDataResponse:
-    """Get graph data for visualization.
+# Static part of a failed /data response; only "error" varies
+_EMPTY_GRAPH_DATA = {
+    "success": False,
+    "nodes": [],
+    "edges": [],
+    "labels": [],
+    "stats": {"node_count": 0, "edge_count": 0, "label_count": 0},
+    "error": None,
+}
+
+
+async def _load_graph_data(client: GraphitiClient, limit: int, group_id: str | None) -> dict:
+    """Fetch graph data from the client and wrap it in the /data envelope.
 
-    Returns nodes, edges, and triplets in a format suitable for D3.js visualization.
-    Proxies to MCP server /graph/data endpoint.
+    Unlike the other routes, errors are caught here rather than left to
+    ErrorEnvelopeRoute: the frontend renders the /data body as the graph, so
+    even a failed load must keep the empty nodes/edges/stats shape.
     """
     try:
-        client = get_graphiti_client()
         data = await client.get_graph_data(limit=limit, group_id=group_id)
 
         if not data.get("success", False):
-            return GraphDataResponse(
-                success=False,
-                nodes=[],
-                edges=[],
-                triplets=[],
-                labels=[],
-                stats={"node_count": 0, "edge_count": 0, "label_count": 0},
-                error=data.get("error", "Unknown error"),
-            )
-
-        # Transform nodes to frontend expected format
-        # Include all relevant properties for node details panel
-        # MCP now returns 'id' and 'type' directly (in addition to 'uuid' and 'primaryLabel')
-        transformed_nodes = [
-            {
-                "id": node.get("id", node.get("uuid", "")),
-                "name": node.get("name", "Unknown"),
-                "type": node.get("type", node.get("primaryLabel", "Entity")),
-                "group_id": node.get("group_id", ""),
-                "summary": node.get("summary", ""),
-                "labels": node.get("labels", []),
-                "created_at": node.get("created_at", ""),
-                "attributes": {
-                    k: v for k, v in node.get("attributes", {}).items()
-                    if not k.endswith("_embedding")  # Exclude embedding vectors
-                },
-            }
-            for node in data.get("nodes", [])
-        ]
-
-        # Transform edges to frontend expected format
-        # MCP Backend now returns: source, target (UUIDs), type, name, fact, uuid, etc.
-        # Frontend expects: source, target, type, fact, plus metadata
-        # Note: Graphiti stores actual relationship name in 'name' field,
-        # while type(r) is always 'RELATES_TO'
-        transformed_edges = [
-            {
-                "source": edge.get("source", ""),
-                "target": edge.get("target", ""),
-                "type": edge.get("name") or edge.get("type", "RELATES_TO"),
-                "fact": edge.get("fact", ""),
-                "uuid": edge.get("uuid", ""),
-                "group_id": edge.get("group_id", ""),
-                "created_at": edge.get("created_at", ""),
-                "valid_at": edge.get("valid_at"),
-                "expired_at": edge.get("expired_at"),
-                "episodes": edge.get("episodes", []),
-            }
-            for edge in data.get("edges", [])
-        ]
-
-        return GraphDataResponse(
-            success=True,
-            nodes=transformed_nodes,
-            edges=transformed_edges,
-            triplets=data.get("triplets", []),
-            labels=data.get("labels", []),
-            stats=data.get("stats", {}),
-        )
+            return {**_EMPTY_GRAPH_DATA, "error": data.get("error", "Unknown error")}
+
+        return {
+            "success": True,
+            # The client already emits the frontend shape; no second pass needed
+            "nodes": data["nodes"],
+            "edges": data["edges"],
+            "labels": data.get("labels", []),
+            "stats": data.get("stats", {}),
+            "error": None,
+        }
     except Exception as e:
-        return GraphDataResponse(
-            success=False,
-            nodes=[],
-            edges=[],
-            triplets=[],
-            labels=[],
-            stats={"node_count": 0, "edge_count": 0, "label_count": 0},
-            error=str(e),
-        )
+        return {**_EMPTY_GRAPH_DATA, "error": str(e)}
+
 
+async def _load_graph_data_body(
+    client: GraphitiClient, cache_key: GraphDataKey, generation: int
+) -> GraphDataBody:
+    """Load graph data, caching it if the load succeeded.
 
-@router.get("/groups", response_model=GroupIdsResponse)
-async def get_group_ids(current_user: CurrentUser) -> GroupIdsResponse:
-    """Get available group IDs for filtering."""
+    Returns serialized bytes, or the payload dict itself if it is large
+    enough to be streamed as JSON, together with its ETag. Streamed bodies
+    aren't encoded up front, so their ETag is a random token for this load:
+    it stays valid exactly as long as the cached entry (a new load or an
+    edit gives a new one), so conditional requests get a 304 meanwhile.
+    """
+    group_id, limit, media_type = cache_key
+    payload = await _load_graph_data(client, limit, group_id)
+    if media_type == MSGPACK_MEDIA_TYPE:
+        body: bytes | dict = ormsgpack.packb(_binary_uuids(payload), default=str)
+    elif len(payload["nodes"]) + len(payload["edges"]) > GRAPH_DATA_STREAM_THRESHOLD:
+        body = payload
+    else:
+        body = orjson.dumps(payload, default=str)
+    etag = _etag(body) if isinstance(body, bytes) else f'W/"s{secrets.token_hex(8)}"'
+    if payload["success"]:
+        _graph_data_cache.set(cache_key, (body, etag), generation)
+    return body, etag
+
+
+def _uuid_bytes(value: str) -> bytes | str:
+    """Return the 16-byte form of a UUID string (unchanged if it isn't one)."""
     try:
-        client = get_graphiti_client()
-        result = await client.get_group_ids()
-
-        if not result.get("success", False):
-            return GroupIdsResponse(
-                success=False,
-                group_ids=[],
-                error=result.get("error"),
-            )
-
-        return GroupIdsResponse(
-            success=True,
-            group_ids=result.get("group_ids", []),
+        return UUID(value).bytes
+    except (TypeError, ValueError):
+        return value
+
+
+def _binary_uuids(payload: dict) -> dict:
+    """Swap node/edge UUID strings for 16-byte values (MessagePack bin).
+
+    Mutates the payload in place - it is freshly loaded per format and only
+    the packed bytes are cached.
+    """
+    for node in payload["nodes"]:
+        node["id"] = _uuid_bytes(node["id"])
+    for edge in payload["edges"]:
+        edge["uuid"] = _uuid_bytes(edge["uuid"])
+        edge["source"] = _uuid_bytes(edge["source"])
+        edge["target"] = _uuid_bytes(edge["target"])
+    return payload
+
+
+def _iter_json_items(items: list) -> Iterator[bytes]:
+    """Encode a list as the comma-separated JSON items of an array, in chunks."""
+    for start in range(0, len(items), GRAPH_DATA_STREAM_CHUNK):
+        # Strip the surrounding [] so chunks concatenate into one array
+        chunk = orjson.dumps(items[start : start + GRAPH_DATA_STREAM_CHUNK], default=str)[1:-1]
+        yield chunk if start == 0 else b"," + chunk
+
+
+def _iter_graph_data_json(payload: dict) -> Iterator[bytes]:
+    """Encode a /data payload incrementally, producing the same JSON as orjson.dumps."""
+    yield b'{"success":' + orjson.dumps(payload["success"]) + b',"nodes":['
+    yield from _iter_json_items(payload["nodes"])
+    yield b'],"edges":['
+    yield from _iter_json_items(payload["edges"])
+    rest = {k: v for k, v in payload.items() if k not in ("success", "nodes", "edges")}
+    # Remaining keys: reuse orjson's object encoding without its opening brace
+    yield b"]," + orjson.dumps(rest, default=str)[1:]
+
+
+@router.get(
+    "/data",
+    responses={
+        200: {
+            "model": GraphDataResponse,
+            "content": {MSGPACK_MEDIA_TYPE: {}},
+        }
+    },
+)
+async def get_graph_data(
+    request: Request,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+    params: GraphDataQuery,
+) -> Response:
+    """Get graph data for visualization.
+
+    Returns nodes and edges in a format suitable for D3.js visualization.
+    Triplets are not sent; they are just (source node, edge, target node) and
+    can be rebuilt from the two lists by id.
+    Queried directly through the graphiti_core driver.
+
+    The payload is serialized directly with orjson; GraphDataResponse only
+    documents the shape in OpenAPI. Successful responses are cached for
+    GRAPH_DATA_CACHE_TTL seconds per (group_id, limit, format), and concurrent
+    identical requests share a single load. Large graphs are streamed in
+    chunks, so the first bytes go out before the whole payload is encoded.
+
+    Clients sending "Accept: application/msgpack" get the same payload as
+    MessagePack, which is noticeably smaller for UUID-heavy graphs. There,
+    node ids and edge uuid/source/target are 16-byte bin values, not strings.
+    """
+    accept = request.headers.get("accept", "")
+    media_type = MSGPACK_MEDIA_TYPE if MSGPACK_MEDIA_TYPE in accept else JSON_MEDIA_TYPE
+    cache_key = (params.group_id, params.limit, media_type)
+    cached = _graph_data_cache.get(cache_key)
+    if cached is None:
+        # Key loads by cache generation so requests arriving after an edit
+        # don't join a load that started before it
+        generation = _graph_data_cache.generation
+        cached = await _graph_data_loads.run(
+            (cache_key, generation),
+            lambda: _load_graph_data_body(client, cache_key, generation),
         )
-    except Exception as e:
-        return GroupIdsResponse(
-            success=False,
-            group_ids=[],
-            error=str(e),
+    body, etag = cached
+
+    # Body depends on Accept; keep shared caches from mixing formats
+    headers = {"Vary": "Accept", "Cache-Control": GRAPH_CACHE_CONTROL, "ETag": etag}
+    if _not_modified(request, etag):
+        # Browser already has this exact graph - skip the body entirely
+        return Response(status_code=304, headers=headers)
+    if isinstance(body, dict):
+        # Sync iterator: Starlette runs it in the threadpool, off the event loop
+        return StreamingResponse(
+            _iter_graph_data_json(body), media_type=JSON_MEDIA_TYPE, headers=headers
         )
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+@router.get("/groups", response_model=None, responses={200: {"model": GroupIdsResponse}})
+async def get_group_ids(
+    request: Request,
+    response: Response,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict | Response:
+    """Get available group IDs for filtering.
+
+    Returns a plain dict (shape of GroupIdsResponse) so FastAPI skips
+    validating the response against the model.
+    """
+    result = await client.get_group_ids()
+
+    if not result.get("success", False):
+        return {"success": False, "group_ids": [], "error": result.get("error")}
+
+    group_ids = result.get("group_ids", [])
+    etag = _etag(orjson.dumps(group_ids))
+    headers = {"ETag": etag, "Cache-Control": GRAPH_CACHE_CONTROL}
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+    return {"success": True, "group_ids": group_ids, "error": None}
+
+
+# Graphiti UUIDs (hex with optional dashes); anything else can't match a record
+_UUID_RE = re.compile(r"\A[0-9a-fA-F-]{32,36}\Z")
+
+
+def _check_uuid(uuid: str) -> None:
+    """Reject a malformed UUID with a 400, without a DB round-trip."""
+    if not _UUID_RE.match(uuid):
+        raise HTTPException(status_code=400, detail=f"Invalid UUID: {uuid!r}")
+
+
+def _node_details(node: dict) -> dict:
+    """Shape client node details for the details panel."""
+    return {
+        "uuid": node.get("uuid", ""),
+        "name": node.get("name", "Unknown"),
+        "summary": node.get("summary", ""),
+        "labels": node.get("labels", []),
+        "group_id": node.get("group_id", ""),
+        "created_at": node.get("created_at", ""),
+        "attributes": node,  # Full node data as attributes
+    }
 
 
 @router.get("/node/{uuid}")
 async def get_node_details(
     uuid: str,
     current_user: CurrentUser,
-    group_id: str | None = Query(default=None, description="Graph to search in"),
+    client: GraphitiDep,
+    params: GraphQuery,
 ) -> dict:
     """Get detailed information about a specific node."""
-    try:
-        client = get_graphiti_client()
-        result = await client.get_node_details(uuid, group_id=group_id)
+    _check_uuid(uuid)
+    result = await client.get_node_details(uuid, group_id=params.group_id)
 
-        if result.get("success"):
-            node = result.get("node", {})
-            return {
-                "success": True,
-                "node": {
-                    "uuid": node.get("uuid", ""),
-                    "name": node.get("name", "Unknown"),
-                    "summary": node.get("summary", ""),
-                    "labels": node.get("labels", []),
-                    "group_id": node.get("group_id", ""),
-                    "created_at": node.get("created_at", ""),
-                    "attributes": node,  # Full node data as attributes
-                },
-            }
-
-        return {"success": False, "error": result.get("error", "Node not found")}
+    if result.get("success"):
+        return {"success": True, "node": _node_details(result.get("node", {}))}
 
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {"success": False, "error": result.get("error", "Node not found")}
 
 
 @router.get("/edge/{uuid}")
 async def get_edge_details(
     uuid: str,
     current_user: CurrentUser,
-    group_id: str | None = Query(default=None, description="Graph to search in"),
+    client: GraphitiDep,
+    params: GraphQuery,
 ) -> dict:
     """Get detailed information about a specific edge."""
-    try:
-        client = get_graphiti_client()
-        result = await client.get_edge_details(uuid, group_id=group_id)
+    _check_uuid(uuid)
+    result = await client.get_edge_details(uuid, group_id=params.group_id)
 
-        if result.get("success"):
-            return {
-                "success": True,
-                "edge": result.get("edge", {}),
-                "source": result.get("source", {}),
-                "target": result.get("target", {}),
-            }
+    if result.get("success"):
+        return {
+            "success": True,
+            "edge": result.get("edge", {}),
+            "source": result.get("source", {}),
+            "target": result.get("target", {}),
+        }
 
-        return {"success": False, "error": result.get("error", "Edge not found")}
+    return {"success": False, "error": result.get("error", "Edge not found")}
 
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+
+class LookupRequest(BaseModel):
+    """Request to fetch several nodes, edges and episodes at once."""
+
+    node_uuids: list[str] = Field(default_factory=list, max_length=1000)
+    edge_uuids: list[str] = Field(default_factory=list, max_length=1000)
+    episode_uuids: list[str] = Field(default_factory=list, max_length=1000)
+    group_id: str | None = None
+
+
+@router.post("/lookup")
+async def lookup_batch(
+    request: LookupRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
+    """Get details for several nodes, edges and episodes in one request.
+
+    Saves the frontend one round-trip per item when opening related details
+    (e.g. both endpoints of an edge).
+    """
+    # Malformed UUIDs can't match anything; drop them before querying
+    result = await client.lookup_batch(
+        node_uuids=[u for u in request.node_uuids if _UUID_RE.match(u)],
+        edge_uuids=[u for u in request.edge_uuids if _UUID_RE.match(u)],
+        episode_uuids=[u for u in request.episode_uuids if _UUID_RE.match(u)],
+        group_id=request.group_id,
+    )
+
+    if result.get("success"):
+        return {
+            "success": True,
+            "nodes": [_node_details(n) for n in result.get("nodes", [])],
+            "edges": result.get("edges", []),
+            "episodes": result.get("episodes", []),
+        }
+
+    return {"success": False, "error": result.get("error", "Lookup failed")}
 
 
 @router.delete("/group/{group_id}")
-async def delete_graph(group_id: str, current_user: CurrentUser) -> dict:
-    """Delete an entire graph (group) via MCP server.
+async def delete_graph(group_id: str, current_user: CurrentUser, client: GraphitiDep) -> dict:
+    """Delete an entire graph (group) via graphiti_core.
 
     WARNING: This permanently deletes all nodes and edges in this graph.
     """
-    try:
-        client = get_graphiti_client()
-        result = await client.delete_graph(group_id)
+    result = await client.delete_graph(group_id)
+    invalidate_graph_cache(group_id)
 
-        if result.get("success"):
-            return {
-                "success": True,
-                "message": result.get("message", f"Graph '{group_id}' deleted successfully"),
-            }
+    if result.get("success"):
         return {
-            "success": False,
-            "error": result.get("error", f"Failed to delete graph '{group_id}'"),
+            "success": True,
+            "message": result.get("message", f"Graph '{group_id}' deleted successfully"),
         }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": False,
+        "error": result.get("error", f"Failed to delete graph '{group_id}'"),
+    }
 
 
 class RenameGroupRequest(BaseModel):
@@ -238,112 +449,118 @@ class RenameGroupRequest(BaseModel):
 
 
 @router.put("/group/{group_id}/rename")
-async def rename_graph(group_id: str, request: RenameGroupRequest, current_user: CurrentUser) -> dict:
-    """Rename a graph (group_id) via MCP server.
+async def rename_graph(
+    group_id: str,
+    request: RenameGroupRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
+    """Rename a graph (group_id) via graphiti_core.
 
     Args:
         group_id: Current graph/group name to rename
         request.new_name: New name for the graph/group
     """
-    try:
-        if not request.new_name or not request.new_name.strip():
-            return {"success": False, "error": "New name cannot be empty"}
+    if not request.new_name or not request.new_name.strip():
+        return {"success": False, "error": "New name cannot be empty"}
 
-        new_name = request.new_name.strip()
-        if new_name == group_id:
-            return {"success": False, "error": "New name is the same as current name"}
+    new_name = request.new_name.strip()
+    if new_name == group_id:
+        return {"success": False, "error": "New name is the same as current name"}
 
-        client = get_graphiti_client()
-        result = await client.rename_graph(group_id, new_name)
+    result = await client.rename_graph(group_id, new_name)
+    invalidate_graph_cache()
 
-        if result.get("success"):
-            return {
-                "success": True,
-                "message": result.get("message", f"Graph renamed from '{group_id}' to '{new_name}'"),
-                "new_name": new_name,
-            }
+    if result.get("success"):
         return {
-            "success": False,
-            "error": result.get("error", "Failed to rename graph"),
+            "success": True,
+            "message": result.get("message", f"Graph renamed from '{group_id}' to '{new_name}'"),
+            "new_name": new_name,
         }
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": False,
+        "error": result.get("error", "Failed to rename graph"),
+    }
 
 
 @router.get("/episode/{uuid}")
 async def get_episode_details(
     uuid: str,
     current_user: CurrentUser,
-    group_id: str | None = Query(default=None, description="Graph to search in"),
+    client: GraphitiDep,
+    params: GraphQuery,
 ) -> dict:
     """Get detailed information about a specific episode."""
-    try:
-        client = get_graphiti_client()
-        result = await client.get_episode_details(uuid, group_id=group_id)
-
-        if result.get("success"):
-            return {
-                "success": True,
-                "episode": result.get("episode", {}),
-            }
+    _check_uuid(uuid)
+    result = await client.get_episode_details(uuid, group_id=params.group_id)
 
-        return {"success": False, "error": result.get("error", "Episode not found")}
+    if result.get("success"):
+        return {
+            "success": True,
+            "episode": result.get("episode", {}),
+        }
 
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {"success": False, "error": result.get("error", "Episode not found")}
 
 
-@router.get("/stats")
+@router.get("/stats", response_model=None)
 async def get_graph_stats(
+    request: Request,
+    response: Response,
     current_user: CurrentUser,
-    group_id: str | None = Query(default=None, description="Filter by group ID"),
-) -> dict:
-    """Get graph statistics."""
-    try:
-        client = get_graphiti_client()
-        result = await client.get_graph_stats(group_id=group_id)
+    client: GraphitiDep,
+    params: GraphQuery,
+) -> dict | Response:
+    """Get graph statistics.
 
+    Successful results are cached for GRAPH_STATS_CACHE_TTL seconds per
+    group_id, and concurrent identical requests share a single query.
+    """
+    cache_key = (params.group_id,)
+    stats = _graph_stats_cache.get(cache_key)
+    if stats is None:
+        generation = _graph_stats_cache.generation
+        result = await _graph_stats_loads.run(
+            (cache_key, generation),
+            lambda: client.get_graph_stats(group_id=params.group_id),
+        )
         if result.get("success"):
-            return {
-                "success": True,
-                "stats": result.get("stats", {}),
-            }
-
+            stats = result.get("stats", {})
+            _graph_stats_cache.set(cache_key, stats, generation)
+
+    if stats is not None:
+        etag = _etag(orjson.dumps(stats))
+        headers = {"ETag": etag, "Cache-Control": GRAPH_CACHE_CONTROL}
+        if _not_modified(request, etag):
+            return Response(status_code=304, headers=headers)
+        response.headers.update(headers)
         return {
-            "success": False,
-            "error": result.get("error"),
-            "stats": {"node_count": 0, "edge_count": 0, "label_count": 0},
+            "success": True,
+            "stats": stats,
         }
 
-    except Exception as e:
-        return {"success": False, "error": str(e), "stats": {}}
+    return {
+        "success": False,
+        "error": result.get("error"),
+        "stats": {"node_count": 0, "edge_count": 0, "label_count": 0},
+    }
 
 
 @router.get("/queue/status")
-async def get_queue_status(current_user: CurrentUser) -> dict:
+async def get_queue_status(current_user: CurrentUser, client: GraphitiDep) -> dict:
     """Get queue processing status for UI indicator."""
-    try:
-        client = get_graphiti_client()
-        result = await client.get_queue_status()
+    result = await client.get_queue_status()
 
-        return {
-            "success": result.get("success", False),
-            "processing": result.get("processing", False),
-            "pending_count": result.get("pending_count", 0),
-            "active_workers": result.get("active_workers", 0),
-        }
-    except Exception as e:
-        return {
-            "success": False,
-            "processing": False,
-            "pending_count": 0,
-            "active_workers": 0,
-            "error": str(e),
-        }
+    return {
+        "success": result.get("success", False),
+        "processing": result.get("processing", False),
+        "pending_count": result.get("pending_count", 0),
+        "active_workers": result.get("active_workers", 0),
+    }
 
 
 # ============================================
-# Graph Editor Endpoints (proxy to MCP server)
+# Graph Editor Endpoints (direct via graphiti_core)
 # ============================================
 
 
@@ -357,6 +574,18 @@ class CreateNodeDirectRequest(BaseModel):
     attributes: dict[str, str] | None = None
 
 
+class BulkNodeItem(CreateNodeDirectRequest):
+    """One node of a bulk create, with an optional client-side reference."""
+
+    temp_id: str | None = None
+
+
+class BulkCreateNodesRequest(BaseModel):
+    """Request to create many nodes directly (no LLM)."""
+
+    nodes: list[BulkNodeItem] = Field(min_length=1, max_length=1000)
+
+
 class CreateEdgeDirectRequest(BaseModel):
     """Request to create an edge directly (no LLM)."""
 
@@ -367,6 +596,18 @@ class CreateEdgeDirectRequest(BaseModel):
     group_id: str
 
 
+class BulkEdgeItem(CreateEdgeDirectRequest):
+    """One edge of a bulk create, with an optional client-side reference."""
+
+    temp_id: str | None = None
+
+
+class BulkCreateEdgesRequest(BaseModel):
+    """Request to create many edges directly (no LLM)."""
+
+    edges: list[BulkEdgeItem] = Field(min_length=1, max_length=1000)
+
+
 class SendKnowledgeRequest(BaseModel):
     """Request to send knowledge to LLM for extraction."""
 
@@ -393,142 +634,224 @@ class UpdateEdgeRequest(BaseModel):
 
 
 @router.post("/node/direct")
-async def create_node_direct(request: CreateNodeDirectRequest, current_user: CurrentUser) -> dict:
+async def create_node_direct(
+    request: CreateNodeDirectRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
     """Create a new node directly without LLM processing.
 
     Creates the entity exactly as specified with embeddings only.
     """
-    try:
-        client = get_graphiti_client()
-        result = await client.create_entity_direct(
-            name=request.name,
-            entity_type=request.entity_type,
-            summary=request.summary,
-            group_id=request.group_id,
-            attributes=request.attributes,
-        )
+    result = await client.create_entity_direct(
+        name=request.name,
+        entity_type=request.entity_type,
+        summary=request.summary,
+        group_id=request.group_id,
+        attributes=request.attributes,
+    )
+    invalidate_graph_cache(request.group_id)
+
+    if result.get("success"):
+        return {
+            "success": True,
+            "message": f"Entity '{request.name}' created",
+            "uuid": result.get("uuid"),
+            "data": result,
+        }
+    return {"success": False, "error": result.get("error", "Unknown error")}
+
 
+@router.post("/node/direct/bulk")
+async def create_nodes_direct_bulk(
+    request: BulkCreateNodesRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
+    """Create many nodes directly without LLM processing.
+
+    Items are created concurrently instead of one request each. Results are
+    keyed by each item's temp_id (or its list index if none was given):
+    "created" maps to the new UUID, "errors" to the failure message.
+    """
+    results = await client.bulk_create_entities([
+        node.model_dump(exclude={"temp_id"}) for node in request.nodes
+    ])
+    for group_id in {node.group_id for node in request.nodes}:
+        invalidate_graph_cache(group_id)
+
+    created: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    for index, (node, result) in enumerate(zip(request.nodes, results, strict=True)):
+        key = node.temp_id or str(index)
         if result.get("success"):
-            return {
-                "success": True,
-                "message": f"Entity '{request.name}' created",
-                "uuid": result.get("uuid"),
-                "data": result,
-            }
-        return {"success": False, "error": result.get("error", "Unknown error")}
+            created[key] = result["uuid"]
+        else:
+            errors[key] = result.get("error", "Unknown error")
 
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": not errors,
+        "message": f"{len(created)} of {len(request.nodes)} entities created",
+        "created": created,
+        "errors": errors,
+    }
 
 
 @router.post("/edge/direct")
-async def create_edge_direct(request: CreateEdgeDirectRequest, current_user: CurrentUser) -> dict:
+async def create_edge_direct(
+    request: CreateEdgeDirectRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
     """Create a new edge directly without LLM processing.
 
     Creates the relationship exactly as specified with embeddings only.
     """
-    try:
-        client = get_graphiti_client()
-        result = await client.create_edge_direct(
-            source_uuid=request.source_uuid,
-            target_uuid=request.target_uuid,
-            name=request.relationship_type,
-            fact=request.fact,
-            group_id=request.group_id,
-        )
+    result = await client.create_edge_direct(
+        source_uuid=request.source_uuid,
+        target_uuid=request.target_uuid,
+        name=request.relationship_type,
+        fact=request.fact,
+        group_id=request.group_id,
+    )
+    invalidate_graph_cache(request.group_id)
+
+    if result.get("success"):
+        return {
+            "success": True,
+            "message": f"Relationship '{request.relationship_type}' created",
+            "uuid": result.get("uuid"),
+            "data": result,
+        }
+    return {"success": False, "error": result.get("error", "Unknown error")}
 
+
+@router.post("/edge/direct/bulk")
+async def create_edges_direct_bulk(
+    request: BulkCreateEdgesRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
+    """Create many edges directly without LLM processing.
+
+    Same result shape as /node/direct/bulk: "created" and "errors" keyed by
+    each item's temp_id (or its list index if none was given).
+    """
+    results = await client.bulk_create_edges([
+        {
+            "source_uuid": edge.source_uuid,
+            "target_uuid": edge.target_uuid,
+            "name": edge.relationship_type,
+            "fact": edge.fact,
+            "group_id": edge.group_id,
+        }
+        for edge in request.edges
+    ])
+    for group_id in {edge.group_id for edge in request.edges}:
+        invalidate_graph_cache(group_id)
+
+    created: dict[str, str] = {}
+    errors: dict[str, str] = {}
+    for index, (edge, result) in enumerate(zip(request.edges, results, strict=True)):
+        key = edge.temp_id or str(index)
         if result.get("success"):
-            return {
-                "success": True,
-                "message": f"Relationship '{request.relationship_type}' created",
-                "uuid": result.get("uuid"),
-                "data": result,
-            }
-        return {"success": False, "error": result.get("error", "Unknown error")}
+            created[key] = result["uuid"]
+        else:
+            errors[key] = result.get("error", "Unknown error")
 
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return {
+        "success": not errors,
+        "message": f"{len(created)} of {len(request.edges)} relationships created",
+        "created": created,
+        "errors": errors,
+    }
 
 
 @router.post("/knowledge")
-async def send_knowledge(request: SendKnowledgeRequest, current_user: CurrentUser) -> dict:
+async def send_knowledge(
+    request: SendKnowledgeRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
     """Send knowledge to LLM for extraction.
 
     The LLM will analyze the text and extract entities and relationships.
     Results appear asynchronously after processing.
     """
-    try:
-        client = get_graphiti_client()
-        result = await client.send_knowledge(
-            content=request.content,
-            group_id=request.group_id,
-        )
-
-        if result.get("success"):
-            return {
-                "success": True,
-                "message": "Knowledge submitted for LLM processing",
-                "data": result.get("data"),
-            }
-        return {"success": False, "error": result.get("error", "Unknown error")}
-
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    result = await client.send_knowledge(
+        content=request.content,
+        group_id=request.group_id,
+    )
+    # Nothing to invalidate: the MCP server ingests asynchronously, after this
+    # returns. The short cache TTLs pick up its results.
+
+    if result.get("success"):
+        return {
+            "success": True,
+            "message": "Knowledge submitted for LLM processing",
+            "data": result.get("data"),
+        }
+    return {"success": False, "error": result.get("error", "Unknown error")}
 
 
 @router.put("/node/{uuid}")
 async def update_node(
-    uuid: str, request: UpdateNodeRequest, current_user: CurrentUser, group_id: str | None = None
+    uuid: str,
+    request: UpdateNodeRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+    group_id: str | None = None,
 ) -> dict:
-    """Update a node's properties via MCP server (includes embedding regeneration).
+    """Update a node's properties via graphiti_core (includes embedding regeneration).
 
     Args:
         uuid: Node UUID to update
         group_id: Graph/group ID (required for FalkorDB)
     """
-    try:
-        client = get_graphiti_client()
-        result = await client.update_entity_node(
-            uuid=uuid,
-            name=request.name,
-            summary=request.summary,
-            entity_type=request.entity_type,
-            group_id=group_id,
-            attributes=request.attributes,
-        )
-        return result
-
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    result = await client.update_entity_node(
+        uuid=uuid,
+        name=request.name,
+        summary=request.summary,
+        entity_type=request.entity_type,
+        group_id=group_id,
+        attributes=request.attributes,
+    )
+    invalidate_graph_cache(group_id)
+    return result
 
 
 @router.put("/edge/{uuid}")
 async def update_edge(
-    uuid: str, request: UpdateEdgeRequest, current_user: CurrentUser, group_id: str | None = None
+    uuid: str,
+    request: UpdateEdgeRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+    group_id: str | None = None,
 ) -> dict:
-    """Update an edge's properties via MCP server (includes embedding regeneration).
+    """Update an edge's properties via graphiti_core (includes embedding regeneration).
 
     Args:
         uuid: Edge UUID to update
         group_id: Graph/group ID (required for FalkorDB)
     """
-    try:
-        client = get_graphiti_client()
-        result = await client.update_entity_edge(
-            uuid=uuid,
-            name=request.name,
-            fact=request.fact,
-            group_id=group_id,
-        )
-        return result
-
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    result = await client.update_entity_edge(
+        uuid=uuid,
+        name=request.name,
+        fact=request.fact,
+        group_id=group_id,
+    )
+    invalidate_graph_cache(group_id)
+    return result
 
 
 @router.delete("/node/{uuid}")
-async def delete_node(uuid: str, current_user: CurrentUser, group_id: str | None = None) -> dict:
-    """Delete a node via MCP server.
+async def delete_node(
+    uuid: str,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+    group_id: str | None = None,
+) -> dict:
+    """Delete a node via graphiti_core.
 
     This removes the entity and all connected edges from the graph.
 
@@ -536,41 +859,38 @@ async def delete_node(uuid: str, current_user: CurrentUser, group_id: str | None
         uuid: Node UUID to delete
         group_id: Graph/group ID (required for FalkorDB)
     """
-    try:
-        client = get_graphiti_client()
-        result = await client.delete_entity_node(uuid, group_id=group_id)
-
-        if result.get("success"):
-            return {
-                "success": True,
-                "message": "Node deleted successfully",
-                "data": result.get("data"),
-            }
-        return {"success": False, "error": result.get("error", "Unknown error")}
+    result = await client.delete_entity_node(uuid, group_id=group_id)
+    invalidate_graph_cache(group_id)
 
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    if result.get("success"):
+        return {
+            "success": True,
+            "message": "Node deleted successfully",
+            "data": result.get("data"),
+        }
+    return {"success": False, "error": result.get("error", "Unknown error")}
 
 
 @router.delete("/edge/{uuid}")
-async def delete_edge(uuid: str, current_user: CurrentUser, group_id: str | None = None) -> dict:
-    """Delete an edge via MCP server.
+async def delete_edge(
+    uuid: str,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+    group_id: str | None = None,
+) -> dict:
+    """Delete an edge via graphiti_core.
 
     Args:
         uuid: Edge UUID to delete
         group_id: Graph/group ID (required for FalkorDB)
     """
-    try:
-        client = get_graphiti_client()
-        result = await client.delete_entity_edge(uuid, group_id=group_id)
+    result = await client.delete_entity_edge(uuid, group_id=group_id)
+    invalidate_graph_cache(group_id)
 
-        if result.get("success"):
-            return {
-                "success": True,
-                "message": "Edge deleted successfully",
-                "data": result.get("data"),
-            }
-        return {"success": False, "error": result.get("error", "Unknown error")}
-
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    if result.get("success"):
+        return {
+            "success": True,
+            "message": "Edge deleted successfully",
+            "data": result.get("data"),
+        }
+    return {"success": False, "error": result.get("error", "Unknown error")}
@@ -10,12 +10,18 @@ Proxies requests to the Graphiti MCP server after validating API keys.
 
 import httpx
 from fastapi import APIRouter, Request, Response, HTTPException, status
+from fastapi.responses import StreamingResponse
+from starlette.background import BackgroundTask
 
 from ..config import get_settings
 from ..services.api_key_service import validate_api_key
 
 router = APIRouter()
 
+# Hop-specific headers not forwarded (names as Starlette/httpx give them: lowercase)
+_SKIP_REQUEST_HEADERS = frozenset({"host", "authorization"})
+_SKIP_RESPONSE_HEADERS = frozenset({"transfer-encoding", "content-encoding", "content-length"})
+
 
 def get_api_key_from_header(request: Request) -> str | None:
     """Extract API key from Authorization header."""
@@ -59,38 +65,51 @@ async def proxy_mcp(request: Request, path: str) -> Response:
         if path:
             mcp_url = f"{mcp_url}/{path}"
 
-    # Get request body if present
-    body = await request.body()
+    # Pass the raw query string through as-is (keeps repeated keys, no re-encoding)
+    if request.url.query:
+        mcp_url = f"{mcp_url}?{request.url.query}"
 
-    # Forward headers (except Authorization and Host)
-    headers = {
-        key: value
+    # Forward headers (except Authorization and Host). Content-Length stays,
+    # so the streamed body below isn't re-sent as a chunked upload.
+    headers = [
+        (key, value)
         for key, value in request.headers.items()
-        if key.lower() not in ("host", "authorization", "content-length")
-    }
-    headers["Content-Type"] = request.headers.get("Content-Type", "application/json")
+        if key not in _SKIP_REQUEST_HEADERS
+    ]
+    if "content-type" not in request.headers:
+        headers.append(("content-type", "application/json"))
+
+    # Stream the request body through instead of reading it into memory
+    content = None
+    if "content-length" in request.headers or "transfer-encoding" in request.headers:
+        content = request.stream()
+
+    # Shared client from the app lifespan keeps connections to the MCP server alive
+    client: httpx.AsyncClient = request.app.state.mcp_proxy_client
 
     try:
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            response = await client.request(
-                method=request.method,
-                url=mcp_url,
-                content=body if body else None,
-                headers=headers,
-                params=dict(request.query_params),
-            )
-
-            # Return response with original status and headers
-            return Response(
-                content=response.content,
-                status_code=response.status_code,
-                headers={
-                    key: value
-                    for key, value in response.headers.items()
-                    if key.lower() not in ("transfer-encoding", "content-encoding")
-                },
-                media_type=response.headers.get("content-type", "application/json"),
-            )
+        upstream_request = client.build_request(
+            method=request.method,
+            url=mcp_url,
+            content=content,
+            headers=headers,
+        )
+        response = await client.send(upstream_request, stream=True)
+
+        # Relay the (decoded) body as it arrives - MCP replies may be SSE
+        # streams - with original status and headers; the upstream
+        # response is closed once the body has been sent
+        return StreamingResponse(
+            response.aiter_bytes(),
+            status_code=response.status_code,
+            headers={
+                key: value
+                for key, value in response.headers.items()
+                if key not in _SKIP_RESPONSE_HEADERS
+            },
+            media_type=response.headers.get("content-type", "application/json"),
+            background=BackgroundTask(response.aclose),
+        )
 
     except httpx.TimeoutException:
         raise HTTPException(
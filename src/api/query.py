@@ -9,13 +9,42 @@ These routes proxy to the Graphiti MCP server which handles database access.
 This ensures database abstraction (FalkorDB vs Neo4j) is handled by Graphiti.
 """
 
+import asyncio
+
 from fastapi import APIRouter
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from ..auth.dependencies import CurrentUser
-from ..services.graphiti_service import get_graphiti_client
+from ..services.cache_service import SingleFlight, TTLCache
+from ..services.graphiti_service import GraphitiClient, is_write_query
+from .dependencies import GraphitiDep
+from .routing import ErrorEnvelopeRoute
+
+# Uncaught errors become {"success": false, "error": ...} responses
+router = APIRouter(route_class=ErrorEnvelopeRoute)
+
+# "Query all graphs" fans out one query per graph; cap how many run at once
+QUERY_ALL_GRAPHS_CONCURRENCY = 8
+
+# Batch search: max queries per request and MCP searches in flight at once
+SEARCH_BATCH_MAX_QUERIES = 48
+SEARCH_BATCH_CONCURRENCY = 8
 
-router = APIRouter()
+# Dashboards re-run the same read query on refresh; share successful results
+# per (query, graph) for a couple of seconds and coalesce identical misses.
+# Cleared by graph edits (see invalidate_query_cache); large results aren't kept.
+QUERY_CACHE_TTL = 2.0
+QUERY_CACHE_MAX_ROWS = 1000
+_query_cache: TTLCache[tuple[str, str], dict] = TTLCache(ttl=QUERY_CACHE_TTL, maxsize=32)
+_query_loads: SingleFlight[tuple[tuple[str, str], int], dict] = SingleFlight()
+
+
+def invalidate_query_cache(group_id: str | None = None) -> None:
+    """Drop cached query results for group_id (all graphs if None)."""
+    if group_id is None:
+        _query_cache.invalidate()
+    else:
+        _query_cache.invalidate(lambda key: key[1] == group_id)
 
 
 class NodeSearchRequest(BaseModel):
@@ -33,36 +62,28 @@ class FactSearchRequest(BaseModel):
     limit: int = 10
 
 
-@router.post("/nodes")
-async def search_nodes(request: NodeSearchRequest, current_user: CurrentUser) -> dict:
-    """Search for nodes in the knowledge graph."""
-    client = get_graphiti_client()
-    result = await client.search_nodes(
-        query=request.query,
-        limit=request.limit,
-        entity_types=request.entity_types,
-    )
-
+def _search_response(query: str, result: dict) -> dict:
+    """Shape an MCP search result for the frontend."""
     if result["success"]:
         data = result.get("data", {})
-        # Extract nodes from MCP response
+        # Extract items from MCP response
         content = data.get("content", [])
-        nodes = []
+        items = []
         if content and isinstance(content, list):
             for item in content:
                 if isinstance(item, dict) and item.get("type") == "text":
                     # Parse text content (MCP returns text)
-                    nodes.append({"text": item.get("text", "")})
+                    items.append({"text": item.get("text", "")})
 
         return {
-            "query": request.query,
-            "results": nodes,
-            "total": len(nodes),
+            "query": query,
+            "results": items,
+            "total": len(items),
             "success": True,
         }
 
     return {
-        "query": request.query,
+        "query": query,
         "results": [],
         "total": 0,
         "success": False,
@@ -70,44 +91,88 @@ async def search_nodes(request: NodeSearchRequest, current_user: CurrentUser) ->
     }
 
 
+@router.post("/nodes")
+async def search_nodes(
+    request: NodeSearchRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
+    """Search for nodes in the knowledge graph."""
+    result = await client.search_nodes(
+        query=request.query,
+        limit=request.limit,
+        entity_types=request.entity_types,
+    )
+    return _search_response(request.query, result)
+
+
 @router.post("/facts")
-async def search_facts(request: FactSearchRequest, current_user: CurrentUser) -> dict:
+async def search_facts(
+    request: FactSearchRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
     """Search for facts (edges) in the knowledge graph."""
-    client = get_graphiti_client()
     result = await client.search_facts(
         query=request.query,
         limit=request.limit,
     )
+    return _search_response(request.query, result)
 
-    if result["success"]:
-        data = result.get("data", {})
-        content = data.get("content", [])
-        facts = []
-        if content and isinstance(content, list):
-            for item in content:
-                if isinstance(item, dict) and item.get("type") == "text":
-                    facts.append({"text": item.get("text", "")})
 
-        return {
-            "query": request.query,
-            "results": facts,
-            "total": len(facts),
-            "success": True,
-        }
+class BatchSearchRequest(BaseModel):
+    """Several node and/or fact searches in one request."""
+
+    queries: list[str] = Field(min_length=1, max_length=SEARCH_BATCH_MAX_QUERIES)
+    entity_types: list[str] | None = None
+    limit: int = 10
+    nodes: bool = True
+    facts: bool = True
+
+
+@router.post("/batch")
+async def search_batch(
+    request: BatchSearchRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
+    """Run node and fact searches for several queries concurrently.
+
+    Duplicate queries are searched once. Returns one entry per input query,
+    in order, holding the /nodes and/or /facts response for it.
+    """
+    unique_queries = list(dict.fromkeys(request.queries))
+    semaphore = asyncio.Semaphore(SEARCH_BATCH_CONCURRENCY)
+
+    async def search(kind: str, query: str) -> dict:
+        async with semaphore:
+            if kind == "nodes":
+                result = await client.search_nodes(
+                    query=query,
+                    limit=request.limit,
+                    entity_types=request.entity_types,
+                )
+            else:
+                result = await client.search_facts(query=query, limit=request.limit)
+        return _search_response(query, result)
+
+    kinds = [kind for kind in ("nodes", "facts") if getattr(request, kind)]
+    keys = [(kind, query) for query in unique_queries for kind in kinds]
+    responses = await asyncio.gather(*(search(kind, query) for kind, query in keys))
+    by_key = dict(zip(keys, responses, strict=True))
 
     return {
-        "query": request.query,
-        "results": [],
-        "total": 0,
-        "success": False,
-        "error": result.get("error", "Unknown error"),
+        "results": [
+            {"query": query, **{kind: by_key[(kind, query)] for kind in kinds}}
+            for query in request.queries
+        ],
+        "success": True,
     }
 
 
 @router.get("/health")
-async def check_graphiti_health(current_user: CurrentUser) -> dict:
+async def check_graphiti_health(current_user: CurrentUser, client: GraphitiDep) -> dict:
     """Check Graphiti MCP server health."""
-    client = get_graphiti_client()
     return await client.health_check()
 
 
@@ -116,20 +181,54 @@ class QueryRequest(BaseModel):
 
     query: str
     graph_id: str | None = None  # If None, query the default graph
+    no_cache: bool = False  # Skip the short-lived result cache
+
+
+async def _run_query(
+    client: GraphitiClient, query: str, group_id: str, use_cache: bool
+) -> dict:
+    """Run a query on one graph, sharing recent successful results."""
+    if not use_cache:
+        return await client.execute_query(query, group_id=group_id)
+
+    key = (query, group_id)
+    result = _query_cache.get(key)
+    if result is None:
+        # Key loads by generation so queries after an edit don't join an older load
+        generation = _query_cache.generation
+        result = await _query_loads.run(
+            (key, generation), lambda: client.execute_query(query, group_id=group_id)
+        )
+        if result.get("success") and len(result.get("results", ())) <= QUERY_CACHE_MAX_ROWS:
+            _query_cache.set(key, result, generation)
+    return result
 
 
 @router.post("")
-async def execute_query(request: QueryRequest, current_user: CurrentUser) -> dict:
+async def execute_query(
+    request: QueryRequest,
+    current_user: CurrentUser,
+    client: GraphitiDep,
+) -> dict:
     """Execute Cypher query via MCP server.
 
     Note: Only read-only queries are allowed (no DELETE, CREATE, MERGE, SET).
     """
-    try:
-        client = get_graphiti_client()
+    # Reject writes up front instead of once per graph
+    if is_write_query(request.query):
+        return {
+            "query": request.query,
+            "results": [],
+            "success": False,
+            "error": "Only read queries are allowed",
+        }
 
+    try:
         # If querying specific graph
         if request.graph_id:
-            result = await client.execute_query(request.query, group_id=request.graph_id)
+            result = await _run_query(
+                client, request.query, request.graph_id, not request.no_cache
+            )
 
             if result.get("success"):
                 return {
@@ -158,9 +257,20 @@ async def execute_query(request: QueryRequest, current_user: CurrentUser) -> dic
         groups_result = await client.get_group_ids()
         group_ids = groups_result.get("group_ids", [])
 
+        semaphore = asyncio.Semaphore(QUERY_ALL_GRAPHS_CONCURRENCY)
+
+        async def run(gid: str) -> dict:
+            async with semaphore:
+                return await _run_query(client, request.query, gid, not request.no_cache)
+
+        results = await asyncio.gather(
+            *(run(gid) for gid in group_ids), return_exceptions=True
+        )
+
         all_results = []
-        for gid in group_ids:
-            result = await client.execute_query(request.query, group_id=gid)
+        for gid, result in zip(group_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                result = {"success": False, "error": str(result)}
             if result.get("success"):
                 all_results.append({
                     "graph": gid,
@@ -191,10 +301,9 @@ async def execute_query(request: QueryRequest, current_user: CurrentUser) -> dic
 
 
 @router.get("/graphs")
-async def get_available_graphs(current_user: CurrentUser) -> dict:
+async def get_available_graphs(current_user: CurrentUser, client: GraphitiDep) -> dict:
     """Get list of available graphs for querying."""
     try:
-        client = get_graphiti_client()
         result = await client.get_group_ids()
 
         if result.get("success"):
@@ -0,0 +1,43 @@
+# Graphiti UI — Admin interface for Graphiti Knowledge Graph
+# Copyright (c) 2026 Matthias Brusdeylins
+# SPDX-License-Identifier: MIT
+# 100% AI-generated code (vibe-coding with Claude)
+
+"""Custom route classes shared by API routers."""
+
+import logging
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import orjson
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+
+logger = logging.getLogger(__name__)
+
+
+class ErrorEnvelopeRoute(APIRoute):
+    """Route that turns uncaught exceptions into {"success": false, "error": ...}.
+
+    The frontend reads failures from the response body, not the status code,
+    so routes using this class can skip their own try/except boilerplate.
+    HTTP and validation errors (401, 422, ...) still propagate unchanged.
+    """
+
+    def get_route_handler(self) -> Callable[[Request], Coroutine[Any, Any, Response]]:
+        handler = super().get_route_handler()
+
+        async def envelope_handler(request: Request) -> Response:
+            try:
+                return await handler(request)
+            except (HTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.exception(f"Unhandled error in {request.method} {request.url.path}")
+                return Response(
+                    content=orjson.dumps({"success": False, "error": str(e)}),
+                    media_type="application/json",
+                )
+
+        return envelope_handler
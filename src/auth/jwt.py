@@ -5,12 +5,24 @@
 
 """JWT token handling."""
 
+import hashlib
+import time
 from datetime import datetime, timedelta, timezone
 from typing import Any
 
-from jose import JWTError, jwt
+import jwt
+from jwt import InvalidTokenError
 
 from ..config import get_settings
+from ..services.cache_service import TTLCache
+
+# Every authenticated request decodes the same session cookie again; keep
+# verified payloads briefly, keyed by token hash so raw tokens aren't retained
+TOKEN_CACHE_TTL = 60.0
+TOKEN_CACHE_SIZE = 1024
+_token_cache: TTLCache[bytes, dict[str, Any]] = TTLCache(
+    ttl=TOKEN_CACHE_TTL, maxsize=TOKEN_CACHE_SIZE
+)
 
 
 def create_access_token(data: dict[str, Any], expires_delta: timedelta | None = None) -> str:
@@ -30,10 +42,19 @@ def create_access_token(data: dict[str, Any], expires_delta: timedelta | None =
 
 def decode_token(token: str) -> dict[str, Any] | None:
     """Decode and validate a JWT token."""
+    key = hashlib.sha256(token.encode()).digest()
+    payload = _token_cache.get(key)
+    if payload is not None:
+        # Never serve a cached payload past the token's own expiry
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+
     settings = get_settings()
     try:
         secret_key = settings.get_secret_key()
         payload = jwt.decode(token, secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
-    except JWTError:
+    except InvalidTokenError:
         return None
+    _token_cache.set(key, payload)
+    return payload
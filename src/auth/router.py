@@ -5,6 +5,9 @@
 
 """Authentication API routes."""
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
 from fastapi import APIRouter, HTTPException, Response, status
 from pydantic import BaseModel, Field
 
@@ -12,13 +15,18 @@ from ..config import get_settings
 from ..services.credentials_service import (
     is_initialized,
     set_admin_password,
-    verify_admin_password,
+    verify_admin_login,
 )
 from .dependencies import CurrentUser
 from .jwt import create_access_token
 
 router = APIRouter()
 
+# Password hashing takes tens to hundreds of ms of CPU; run it off the event
+# loop on its own small pool so login bursts neither stall other requests
+# nor tie up the default executor (argon2 also needs ~19 MiB per hash)
+_AUTH_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="auth-hash")
+
 
 class LoginRequest(BaseModel):
     """Login request model."""
@@ -91,7 +99,8 @@ async def initial_setup(
         )
 
     # Set admin password
-    set_admin_password(form.password)
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(_AUTH_POOL, set_admin_password, form.password)
 
     settings = get_settings()
 
@@ -125,14 +134,12 @@ async def login(
             detail="Initial setup required. Please complete setup first.",
         )
 
-    # Verify credentials
-    if form.username != settings.admin_username:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Invalid username or password",
-        )
-
-    if not verify_admin_password(form.password):
+    # Verify credentials. The username is compared in constant time and the
+    # password always checked, so response timing doesn't reveal either.
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(
+        _AUTH_POOL, verify_admin_login, form.username, form.password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid username or password",
@@ -5,23 +5,93 @@
 
 """Graphiti UI - FastAPI Application Entry Point."""
 
+import json
 from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import AsyncIterator
 
+import httpx
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.staticfiles import StaticFiles
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.responses import Response
+from starlette.types import ASGIApp, Receive, Scope, Send
 
 from .config import get_settings
+from .services.graphiti_service import get_graphiti_client
 
 # Import routers
-from .api import router as api_router
+from .api import HEALTH_PAYLOAD, router as api_router
 from .auth import router as auth_router
 from .api.mcp_proxy import router as mcp_proxy_router
 
 
+class HealthCheckMiddleware:
+    """Answer GET /api/health directly, before routing and other middleware.
+
+    Load balancers and Docker poll this endpoint constantly; the response is
+    static, so it is sent as precomputed bytes.
+    """
+
+    path = "/api/health"
+    body = json.dumps(HEALTH_PAYLOAD, separators=(",", ":")).encode()
+    headers = [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(body)).encode()),
+    ]
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] == "http"
+            and scope["path"] == self.path
+            and scope["method"] == "GET"
+        ):
+            await send({"type": "http.response.start", "status": 200, "headers": self.headers})
+            await send({"type": "http.response.body", "body": self.body})
+            return
+        await self.app(scope, receive, send)
+
+
+class ProxyAwareGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves the MCP proxy alone.
+
+    Proxied MCP replies may be SSE streams; depending on the Starlette
+    version, GZip would compress and buffer them and stall the client.
+    """
+
+    skip_path = "/mcp"
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and (
+            scope["path"] == self.skip_path or scope["path"].startswith(f"{self.skip_path}/")
+        ):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+class SPAStaticFiles(StaticFiles):
+    """Static files of the Vite build; unknown paths get index.html.
+
+    The React app does its own routing, so any path that is not a built file
+    is answered with the SPA entry point.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        try:
+            return await super().get_response(path, scope)
+        except StarletteHTTPException as exc:
+            if exc.status_code != 404:
+                raise
+            return await super().get_response("index.html", scope)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     """Application lifespan handler."""
@@ -29,8 +99,33 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     print(f"Starting {settings.app_name}...")
     print(f"Graphiti MCP URL: {settings.graphiti_mcp_url}")
     print(f"Config Path: {settings.config_path}")
+
+    # Shared HTTP client for outbound probes (keep-alive / connection reuse)
+    app.state.http_client = httpx.AsyncClient(
+        # Fail fast on dead hosts, but allow slow upstream responses
+        timeout=httpx.Timeout(connect=2.0, read=8.0, write=2.0, pool=1.0),
+        limits=httpx.Limits(
+            max_keepalive_connections=40,
+            max_connections=100,
+            keepalive_expiry=30,
+        ),
+    )
+    # Long-lived client for the MCP proxy; tool calls can take a while
+    app.state.mcp_proxy_client = httpx.AsyncClient(
+        timeout=60.0,
+        limits=httpx.Limits(
+            max_keepalive_connections=50,
+            max_connections=200,
+            keepalive_expiry=30,
+        ),
+    )
+    # Graphiti client singleton; its pooled MCP connection is closed on shutdown
+    app.state.graphiti_client = get_graphiti_client()
     yield
     print("Shutting down...")
+    await app.state.http_client.aclose()
+    await app.state.mcp_proxy_client.aclose()
+    await app.state.graphiti_client.close()
 
 
 def create_app() -> FastAPI:
@@ -45,8 +140,14 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         redoc_url="/api/redoc",
         redirect_slashes=False,  # Prevent 307 redirects on POST requests
+        # Encode plain dict/model route results with orjson instead of stdlib json
+        default_response_class=ORJSONResponse,
     )
 
+    # Middleware wraps every request, so keep it pure ASGI (Starlette's
+    # built-ins or plain ASGI callables) - avoid BaseHTTPMiddleware, which
+    # buffers each response through an extra task and memory stream.
+
     # Add CORS middleware for MCP client access
     app.add_middleware(
         CORSMiddleware,
@@ -56,6 +157,15 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    # Compress larger JSON payloads (entity types, config, graph data).
+    # Level 6 compresses repetitive graph JSON nearly as well as the default 9
+    # at a fraction of the CPU; streamed /data responses are compressed as well.
+    # The MCP proxy is skipped so its SSE streams are relayed unbuffered.
+    app.add_middleware(ProxyAwareGZipMiddleware, minimum_size=1024, compresslevel=6)
+
+    # Outermost: short-circuit health checks before any other middleware
+    app.add_middleware(HealthCheckMiddleware)
+
     # Include API routers
     app.include_router(auth_router, prefix="/api/auth", tags=["auth"])
     app.include_router(api_router, prefix="/api", tags=["api"])
@@ -68,21 +178,9 @@ def create_app() -> FastAPI:
         frontend_dist = Path("/app/frontend/dist")
 
     if frontend_dist.exists():
-        # Serve static assets from Vite build
-        assets_dir = frontend_dist / "assets"
-        if assets_dir.exists():
-            app.mount("/assets", StaticFiles(directory=str(assets_dir)), name="assets")
-
-        # Serve index.html for all non-API routes (SPA routing)
-        @app.get("/{path:path}")
-        async def serve_spa(path: str) -> FileResponse:
-            """Serve React SPA for all routes."""
-            # Check if it's a static file request
-            file_path = frontend_dist / path
-            if file_path.is_file():
-                return FileResponse(file_path)
-            # Otherwise serve index.html for client-side routing
-            return FileResponse(frontend_dist / "index.html")
+        # Mounted last so the API routers above take precedence. Assets and
+        # the SPA are served by one ASGI app, without a FastAPI route per hit.
+        app.mount("/", SPAStaticFiles(directory=str(frontend_dist)), name="spa")
     else:
         # Fallback message when frontend not built
         @app.get("/{path:path}")
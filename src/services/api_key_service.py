@@ -8,8 +8,12 @@
 Stores API keys in a JSON file for MCP endpoint authentication.
 """
 
+import hmac
 import json
+import os
 import secrets
+import tempfile
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -17,6 +21,15 @@ from typing import Any
 # API keys storage file
 API_KEYS_FILE = Path("/app/data/api_keys.json")
 
+# last_used is informational; persist it at most this often (seconds) per key
+LAST_USED_WRITE_INTERVAL = 60
+
+# Keys by key_prefix, rebuilt whenever the file's mtime changes
+_key_index: dict[str, dict[str, Any]] = {}
+_key_index_mtime: int | None = None
+# Monotonic time of the last persisted last_used, by key_prefix
+_last_used_written: dict[str, float] = {}
+
 
 def _ensure_data_dir() -> None:
     """Ensure data directory exists."""
@@ -36,10 +49,52 @@ def _load_api_keys() -> dict[str, Any]:
 
 
 def _save_api_keys(data: dict[str, Any]) -> None:
-    """Save API keys to file."""
+    """Save API keys to file.
+
+    Written to a temp file and renamed into place, so a concurrent
+    validate_api_key never reads (and caches) a half-written file.
+    """
+    global _key_index_mtime
     _ensure_data_dir()
-    with open(API_KEYS_FILE, "w") as f:
-        json.dump(data, f, indent=2)
+    fd, tmp_path = tempfile.mkstemp(dir=API_KEYS_FILE.parent, prefix=".api_keys.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, API_KEYS_FILE)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    # Drop the index; a coarse mtime may not change within the same tick
+    _key_index_mtime = None
+
+
+def _get_key_index() -> dict[str, dict[str, Any]]:
+    """Get API keys indexed by key_prefix, reloading only if the file changed."""
+    global _key_index, _key_index_mtime
+    try:
+        mtime = API_KEYS_FILE.stat().st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is None or mtime != _key_index_mtime:
+        _key_index = {k["key_prefix"]: k for k in _load_api_keys()["keys"]}
+        _key_index_mtime = mtime
+    return _key_index
+
+
+def _touch_last_used(key_prefix: str) -> None:
+    """Persist last_used for a key, throttled to LAST_USED_WRITE_INTERVAL."""
+    now = time.monotonic()
+    last = _last_used_written.get(key_prefix)
+    if last is not None and now - last < LAST_USED_WRITE_INTERVAL:
+        return
+    _last_used_written[key_prefix] = now
+
+    data = _load_api_keys()
+    for k in data["keys"]:
+        if k["key_prefix"] == key_prefix:
+            k["last_used"] = datetime.utcnow().isoformat()
+            _save_api_keys(data)
+            return
 
 
 def generate_api_key() -> str:
@@ -47,6 +102,10 @@ def generate_api_key() -> str:
     return f"gk_{secrets.token_urlsafe(32)}"
 
 
+# Never-issued key of the usual length, compared against on index misses
+_DUMMY_KEY = generate_api_key()
+
+
 def create_api_key(name: str) -> dict[str, Any]:
     """Create a new API key.
 
@@ -129,16 +188,17 @@ def validate_api_key(key: str) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    if not key or not key.startswith("gk_"):
+    # Runs on every proxied MCP request: one stat() and a dict lookup
+    # instead of loading and rewriting the keys file each time. Keys without
+    # the gk_ prefix simply miss the index.
+    entry = _get_key_index().get(key[:12])
+
+    # Compare on every path (a dummy on a miss), so timing doesn't reveal
+    # whether a key prefix exists
+    stored = entry.get("full_key", "") if entry is not None else _DUMMY_KEY
+    key_ok = hmac.compare_digest(stored.encode(), key.encode())
+    if entry is None or not key_ok:
         return False
 
-    data = _load_api_keys()
-
-    for k in data["keys"]:
-        if k.get("full_key") == key:
-            # Update last_used timestamp
-            k["last_used"] = datetime.utcnow().isoformat()
-            _save_api_keys(data)
-            return True
-
-    return False
+    _touch_last_used(entry["key_prefix"])
+    return True
@@ -0,0 +1,83 @@
+# Graphiti UI — Admin interface for Graphiti Knowledge Graph
+# Copyright (c) 2026 Matthias Brusdeylins
+# SPDX-License-Identifier: MIT
+# 100% AI-generated code (vibe-coding with Claude)
+
+"""In-process caching helpers for short-lived API results.
+
+- TTLCache: dict-backed cache with per-entry expiry
+- SingleFlight: coalesces concurrent identical async calls into one
+"""
+
+import asyncio
+import time
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Generic, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Small dict-backed cache whose entries expire after `ttl` seconds.
+
+    Meant for a handful of keys per process (e.g. one per graph), so expired
+    entries are simply replaced on the next write instead of being swept.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 64) -> None:
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: dict[K, tuple[float, V]] = {}
+        # Bumped on every invalidation so in-flight loads can detect staleness
+        self.generation = 0
+
+    def get(self, key: K) -> V | None:
+        """Return the cached value, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            self._entries.pop(key, None)
+            return None
+        return entry[1]
+
+    def set(self, key: K, value: V, generation: int | None = None) -> None:
+        """Store a value, evicting the oldest entry when full.
+
+        If generation is given and the cache was invalidated since, the value
+        is dropped - it was loaded before the change it would now hide.
+        """
+        if generation is not None and generation != self.generation:
+            return
+        if key not in self._entries and len(self._entries) >= self.maxsize:
+            oldest = min(self._entries, key=lambda k: self._entries[k][0])
+            self._entries.pop(oldest, None)
+        self._entries[key] = (time.monotonic(), value)
+
+    def invalidate(self, predicate: Callable[[K], bool] | None = None) -> None:
+        """Drop entries whose key matches predicate (all entries if None)."""
+        self.generation += 1
+        if predicate is None:
+            self._entries.clear()
+            return
+        for key in [k for k in self._entries if predicate(k)]:
+            self._entries.pop(key, None)
+
+
+class SingleFlight(Generic[K, V]):
+    """Share one in-flight call per key between concurrent callers."""
+
+    def __init__(self) -> None:
+        self._inflight: dict[K, asyncio.Task[V]] = {}
+
+    async def run(self, key: K, fetch: Callable[[], Awaitable[V]]) -> V:
+        """Await the in-flight call for key, starting fetch() if there is none."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        # Shield so one cancelled caller doesn't cancel the call for the others
+        return await asyncio.shield(task)
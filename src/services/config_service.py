@@ -8,35 +8,64 @@
 Handles reading/writing of config.yaml
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+# libyaml-backed loader/dumper when available (PyYAML wheels bundle it)
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
+
 from ..config import get_settings
 
+# Parsed config.yaml, keyed by file mtime (ns)
+_config_cache: tuple[int, dict[str, Any]] | None = None
+
 
+@lru_cache
 def get_config_path() -> Path:
-    """Get path to config file."""
+    """Get path to config file (cached, like get_settings())."""
     settings = get_settings()
     return Path(settings.config_path)
 
 
 def read_config() -> dict[str, Any]:
-    """Read configuration from YAML file."""
+    """Read configuration from YAML file.
+
+    The parsed config is cached until the file's mtime changes. The returned
+    dict is shared between callers and must be treated as read-only.
+    """
+    global _config_cache
     config_path = get_config_path()
 
-    if not config_path.exists():
+    try:
+        mtime_ns = config_path.stat().st_mtime_ns
+    except FileNotFoundError:
         return {}
 
+    if _config_cache is not None and _config_cache[0] == mtime_ns:
+        return _config_cache[1]
+
     with open(config_path) as f:
-        return yaml.safe_load(f) or {}
+        config = yaml.load(f, Loader=_Loader) or {}
+
+    _config_cache = (mtime_ns, config)
+    return config
 
 
 def write_config(config: dict[str, Any]) -> None:
     """Write configuration to YAML file."""
+    global _config_cache
     config_path = get_config_path()
     config_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(config_path, "w") as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(config, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+
+    _config_cache = None
@@ -11,14 +11,31 @@ Handles:
 - Embedding API credentials (read from environment variables)
 """
 
+import copy
+import hashlib
+import hmac
 import os
+import secrets
+import threading
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import bcrypt
 import yaml
+from argon2 import PasswordHasher
+from argon2.exceptions import InvalidHashError, VerificationError
+
+# libyaml-backed loader/dumper when available (PyYAML wheels bundle it)
+try:
+    from yaml import CSafeDumper as _Dumper
+    from yaml import CSafeLoader as _Loader
+except ImportError:
+    from yaml import SafeDumper as _Dumper
+    from yaml import SafeLoader as _Loader
 
 from ..config import get_settings
+from .cache_service import TTLCache
 
 # Default credentials structure (admin only - LLM/Embedder from env)
 DEFAULT_CREDENTIALS = {
@@ -28,25 +45,52 @@ DEFAULT_CREDENTIALS = {
     },
 }
 
+# Parsed credentials.yaml, keyed by file mtime (ns)
+_credentials_cache: tuple[int, dict[str, Any]] | None = None
+
+# Recently verified (username, password, hash) logins, so repeat logins skip
+# argon2/bcrypt. Only successes are kept, under a per-process HMAC key, so
+# the cache holds nothing that helps an offline guess.
+VERIFIED_PASSWORD_TTL = 30.0
+_verified_passwords: TTLCache[bytes, bool] = TTLCache(ttl=VERIFIED_PASSWORD_TTL, maxsize=8)
+_verified_key = secrets.token_bytes(32)
+# Login runs verification on a thread pool
+_verified_lock = threading.Lock()
+
+# Admin password hashing (argon2id, OWASP minimum profile). Hashes from
+# before the switch are bcrypt ("$2..."), verified as such and upgraded on login.
+_password_hasher = PasswordHasher(time_cost=2, memory_cost=19456, parallelism=1)
 
+
+@lru_cache
 def get_credentials_path() -> Path:
-    """Get path to credentials file."""
+    """Get path to credentials file (cached, like get_settings())."""
     settings = get_settings()
     config_dir = Path(settings.config_path).parent
     return config_dir / "credentials.yaml"
 
 
 def read_credentials() -> dict[str, Any]:
-    """Read credentials from YAML file."""
+    """Read credentials from YAML file.
+
+    The parsed credentials are cached until the file's mtime changes. The
+    returned dict is shared between callers and must be treated as read-only.
+    """
+    global _credentials_cache
     creds_path = get_credentials_path()
 
-    if not creds_path.exists():
+    try:
+        mtime_ns = creds_path.stat().st_mtime_ns
+    except FileNotFoundError:
         # Create default credentials file
         write_credentials(DEFAULT_CREDENTIALS)
-        return DEFAULT_CREDENTIALS.copy()
+        return copy.deepcopy(DEFAULT_CREDENTIALS)
+
+    if _credentials_cache is not None and _credentials_cache[0] == mtime_ns:
+        return _credentials_cache[1]
 
     with open(creds_path) as f:
-        creds = yaml.safe_load(f) or {}
+        creds = yaml.load(f, Loader=_Loader) or {}
 
     # Merge with defaults for any missing keys
     for key, value in DEFAULT_CREDENTIALS.items():
@@ -57,16 +101,20 @@ def read_credentials() -> dict[str, Any]:
                 if subkey not in creds[key]:
                     creds[key][subkey] = subvalue
 
+    _credentials_cache = (mtime_ns, creds)
     return creds
 
 
 def write_credentials(credentials: dict[str, Any]) -> None:
     """Write credentials to YAML file."""
+    global _credentials_cache
     creds_path = get_credentials_path()
     creds_path.parent.mkdir(parents=True, exist_ok=True)
 
     with open(creds_path, "w") as f:
-        yaml.dump(credentials, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(credentials, f, Dumper=_Dumper, default_flow_style=False, sort_keys=False)
+
+    _credentials_cache = None
 
 
 def is_initialized() -> bool:
@@ -75,29 +123,73 @@ def is_initialized() -> bool:
     return creds.get("admin", {}).get("initialized", False)
 
 
-def set_admin_password(password: str) -> None:
-    """Set admin password (hash it and store)."""
-    creds = read_credentials()
-    # Hash password with bcrypt
-    password_bytes = password.encode("utf-8")
-    salt = bcrypt.gensalt()
-    password_hash = bcrypt.hashpw(password_bytes, salt).decode("utf-8")
+def _store_password_hash(password_hash: str) -> None:
+    """Store the admin password hash and mark setup as complete."""
+    # Copy: read_credentials() returns the shared cached dict
+    creds = copy.deepcopy(read_credentials())
     creds["admin"]["password_hash"] = password_hash
     creds["admin"]["initialized"] = True
     write_credentials(creds)
+    with _verified_lock:
+        _verified_passwords.invalidate()
 
 
-def verify_admin_password(password: str) -> bool:
-    """Verify admin password against stored hash."""
+def set_admin_password(password: str) -> None:
+    """Set admin password (hash it and store)."""
+    _store_password_hash(_password_hasher.hash(password))
+
+
+def _check_password(password: str, password_hash: str) -> bool:
+    """Check a password against an argon2 or legacy bcrypt hash.
+
+    Upgrades the stored hash to current argon2 parameters when it matches.
+    """
+    if password_hash.startswith("$2"):
+        if not bcrypt.checkpw(password.encode("utf-8"), password_hash.encode("utf-8")):
+            return False
+    else:
+        try:
+            _password_hasher.verify(password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+        if not _password_hasher.check_needs_rehash(password_hash):
+            return True
+
+    _store_password_hash(_password_hasher.hash(password))
+    return True
+
+
+def verify_admin_login(username: str, password: str) -> bool:
+    """Verify admin username and password against the stored credentials.
+
+    The username is compared in constant time and the password is always
+    fully verified unless this exact username/password pair was verified
+    recently. The cache is only consulted once the username matched, so a
+    wrong username never returns early on a cached password.
+    """
     creds = read_credentials()
     password_hash = creds.get("admin", {}).get("password_hash")
 
     if not password_hash:
         return False
 
-    password_bytes = password.encode("utf-8")
-    hash_bytes = password_hash.encode("utf-8")
-    return bcrypt.checkpw(password_bytes, hash_bytes)
+    username_ok = hmac.compare_digest(
+        username.encode("utf-8"), get_settings().admin_username.encode("utf-8")
+    )
+    key = hmac.digest(
+        _verified_key, f"{username}|{password}|{password_hash}".encode(), hashlib.sha256
+    )
+    if username_ok:
+        with _verified_lock:
+            if _verified_passwords.get(key):
+                return True
+
+    password_ok = _check_password(password, password_hash)
+    if not (username_ok & password_ok):
+        return False
+    with _verified_lock:
+        _verified_passwords.set(key, True)
+    return True
 
 
 def get_llm_credentials() -> dict[str, Any]:
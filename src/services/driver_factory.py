@@ -13,11 +13,35 @@ from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from graphiti_core.driver.driver import GraphDriver
+    from redis.asyncio import BlockingConnectionPool
 
 from ..config import Settings
 
 logger = logging.getLogger(__name__)
 
+# FalkorDB connection pool size and max wait (seconds) for a free connection
+FALKORDB_MAX_CONNECTIONS = 32
+FALKORDB_POOL_TIMEOUT = 5
+
+
+def create_falkordb_pool(settings: Settings) -> "BlockingConnectionPool":
+    """Create the bounded connection pool shared by all FalkorDB graph clones.
+
+    Concurrent requests reuse open connections and wait for a free one instead
+    of opening new sockets without limit. FalkorDB's own decode_responses
+    default is ignored once a pool is passed in, so it is set here.
+    """
+    from redis.asyncio import BlockingConnectionPool
+
+    return BlockingConnectionPool(
+        host=settings.falkordb_host,
+        port=settings.falkordb_port,
+        password=settings.falkordb_password or None,
+        decode_responses=True,
+        max_connections=FALKORDB_MAX_CONNECTIONS,
+        timeout=FALKORDB_POOL_TIMEOUT,
+    )
+
 
 def create_driver(settings: Settings) -> "GraphDriver":
     """Create a GraphDriver based on config settings.
@@ -34,13 +58,12 @@ def create_driver(settings: Settings) -> "GraphDriver":
     provider = settings.graph_provider.lower()
 
     if provider == "falkordb":
+        from falkordb.asyncio import FalkorDB
         from graphiti_core.driver.falkordb_driver import FalkorDriver
 
         logger.info(f"Creating FalkorDriver: {settings.falkordb_host}:{settings.falkordb_port}")
         return FalkorDriver(
-            host=settings.falkordb_host,
-            port=settings.falkordb_port,
-            password=settings.falkordb_password or None,
+            falkor_db=FalkorDB(connection_pool=create_falkordb_pool(settings)),
             database=settings.falkordb_database,
         )
 
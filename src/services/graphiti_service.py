@@ -8,20 +8,166 @@
 Uses the Graphiti class facade for CRUD operations with auto-embedding generation.
 """
 
+import asyncio
 import logging
-from typing import Any
+import re
+import sys
+from collections.abc import Callable
+from typing import Any, NotRequired, TypedDict
 
 import httpx
+import orjson
+import redis.asyncio as redis
 from graphiti_core import Graphiti
 from graphiti_core.driver.driver import GraphDriver
 from graphiti_core.embedder import OpenAIEmbedder, OpenAIEmbedderConfig
 from graphiti_core.errors import EdgeNotFoundError, NodeNotFoundError
 
 from ..config import get_settings
+from .cache_service import SingleFlight
 from .driver_factory import create_driver
 
 logger = logging.getLogger(__name__)
 
+# Group IDs only change on create/delete/rename, but /groups is hit on every
+# page load. Cached in FalkorDB's Redis, so all workers share one entry.
+GROUP_IDS_CACHE_KEY = "graphiti-ui:group_ids"
+GROUP_IDS_CACHE_TTL = 60
+
+# Write clauses rejected by execute_query, matched as whole words anywhere in
+# the raw query (string literals included) so properties like created_at or
+# offset still pass
+_WRITE_QUERY_RE = re.compile(
+    r"\b(?:CREATE|DELETE|DETACH|MERGE|SET|REMOVE|DROP)\b", re.IGNORECASE
+)
+# Procedures that write without a standalone write clause: apoc.cypher.* and
+# apoc.periodic.* run Cypher built from strings, and called procedures whose
+# name contains a write verb (db.idx.fulltext.createNodeIndex, ...drop)
+_WRITE_PROCEDURE_RE = re.compile(
+    r"\bapoc\.(?:cypher|periodic)\.|\bCALL\s+[\w.]*(?:CREATE|DELETE|DROP|MERGE|SET|REMOVE)",
+    re.IGNORECASE,
+)
+
+
+def is_write_query(query: str) -> bool:
+    """Check whether a Cypher query contains a write clause or write procedure."""
+    return (
+        _WRITE_QUERY_RE.search(query) is not None
+        or _WRITE_PROCEDURE_RE.search(query) is not None
+    )
+
+
+# Direct creates embed each item; cap parallel embedding/DB calls in bulk imports
+BULK_CREATE_CONCURRENCY = 8
+
+
+class GraphNode(TypedDict):
+    """Node item of /graph/data, exactly as sent to the frontend."""
+
+    id: str
+    name: str
+    type: str
+    group_id: str
+    summary: str
+    labels: list[str]
+    created_at: str | None
+    attributes: dict[str, Any]
+
+
+class GraphEdge(TypedDict):
+    """Edge item of /graph/data, exactly as sent to the frontend.
+
+    Optional keys are left out rather than sent as null/[] to keep large
+    payloads small; the frontend treats missing and empty alike.
+    """
+
+    source: str
+    target: str
+    type: str
+    fact: str
+    uuid: str
+    group_id: str
+    created_at: str
+    valid_at: NotRequired[str]
+    expired_at: NotRequired[str]
+    episodes: NotRequired[list[str]]
+
+
+# =============================================================================
+# Query Result Serialization
+# =============================================================================
+
+
+def _serialize_node(value: Any) -> dict:
+    """Serialize a FalkorDB Node."""
+    return {
+        'type': 'node',
+        'labels': list(value.labels) if value.labels else [],
+        'properties': dict(value.properties) if value.properties else {},
+    }
+
+
+def _serialize_edge(value: Any) -> dict:
+    """Serialize a FalkorDB Edge/Relationship."""
+    return {
+        'type': 'edge',
+        'relation': value.relation,
+        'properties': dict(value.properties) if value.properties else {},
+    }
+
+
+def _serialize_list(value: list) -> list:
+    return [_serialize_value(v) for v in value]
+
+
+def _serialize_dict(value: dict) -> dict:
+    return {k: _serialize_value(v) for k, v in value.items()}
+
+
+def _passthrough(value: Any) -> Any:
+    return value
+
+
+# Serializer by exact value type. Query results can have thousands of cells,
+# so the type is classified once and each later cell costs one dict lookup.
+_SERIALIZERS: dict[type, Callable[[Any], Any]] = {
+    type(None): _passthrough,
+    str: _passthrough,
+    int: _passthrough,
+    float: _passthrough,
+    bool: _passthrough,
+    list: _serialize_list,
+    dict: _serialize_dict,
+}
+
+
+def _classify(value: Any) -> Callable[[Any], Any]:
+    """Pick and remember the serializer for a type not seen before.
+
+    FalkorDB objects are duck-typed (labels/relation are set per instance)
+    so the falkordb package stays an optional import.
+    """
+    if hasattr(value, 'properties') and hasattr(value, 'labels'):
+        serializer = _serialize_node
+    elif hasattr(value, 'properties') and hasattr(value, 'relation'):
+        serializer = _serialize_edge
+    elif isinstance(value, list):
+        serializer = _serialize_list
+    elif isinstance(value, dict):
+        serializer = _serialize_dict
+    else:
+        serializer = _passthrough
+    _SERIALIZERS[type(value)] = serializer
+    return serializer
+
+
+def _serialize_value(value: Any) -> Any:
+    """Serialize a query result value for JSON response."""
+    serializer = _SERIALIZERS.get(type(value))
+    if serializer is None:
+        serializer = _classify(value)
+    return serializer(value)
+
 
 class GraphitiClient:
     """Client for Graphiti operations via graphiti_core Graphiti class."""
@@ -31,6 +177,13 @@ class GraphitiClient:
         self._driver: GraphDriver | None = None
         self._embedder: OpenAIEmbedder | None = None
         self._graphiti_instances: dict[str, Graphiti] = {}
+        self._http_client: httpx.AsyncClient | None = None
+        self._redis: redis.Redis | None = None
+        # Concurrent group ID lookups share one Redis/DB call. Keyed by a
+        # counter bumped on invalidation, so lookups after a change don't join
+        # an older one.
+        self._group_ids_generation = 0
+        self._group_ids_loads: SingleFlight[int, dict] = SingleFlight()
 
     @property
     def driver(self) -> GraphDriver:
@@ -52,6 +205,37 @@ class GraphitiClient:
             self._embedder = OpenAIEmbedder(config)
         return self._embedder
 
+    def _get_http_client(self) -> httpx.AsyncClient:
+        """Get or create the pooled HTTP client for MCP server calls."""
+        if self._http_client is None:
+            self._http_client = httpx.AsyncClient(
+                timeout=60.0,
+                limits=httpx.Limits(max_keepalive_connections=32, keepalive_expiry=30),
+            )
+        return self._http_client
+
+    def _get_redis(self) -> redis.Redis | None:
+        """Get or create the Redis client for caching (FalkorDB only, else None)."""
+        if self.settings.graph_provider != "falkordb":
+            return None
+        if self._redis is None:
+            self._redis = redis.Redis(
+                host=self.settings.falkordb_host,
+                port=self.settings.falkordb_port,
+                password=self.settings.falkordb_password or None,
+                socket_timeout=1.0,
+            )
+        return self._redis
+
+    async def close(self):
+        """Close HTTP and Redis clients."""
+        if self._http_client:
+            await self._http_client.aclose()
+            self._http_client = None
+        if self._redis:
+            await self._redis.aclose()
+            self._redis = None
+
     def _get_driver(self, group_id: str | None = None) -> GraphDriver:
         """Get driver for specific group_id.
 
@@ -83,11 +267,11 @@ class GraphitiClient:
     async def health_check(self) -> dict:
         """Check if MCP server (and its DB connection) is healthy."""
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.settings.graphiti_mcp_url}/health")
-                response.raise_for_status()
-                data = response.json()
-                return {"healthy": True, "data": data}
+            client = self._get_http_client()
+            response = await client.get(f"{self.settings.graphiti_mcp_url}/health", timeout=10.0)
+            response.raise_for_status()
+            data = response.json()
+            return {"healthy": True, "data": data}
         except Exception as e:
             return {"healthy": False, "error": str(e)}
 
@@ -95,44 +279,54 @@ class GraphitiClient:
     # Graph Data (for visualization)
     # =========================================================================
 
-    async def get_graph_data(self, limit: int = 500, group_id: str | None = None) -> dict:
+    async def get_graph_data(
+        self, limit: int = 500, group_id: str | None = None, include_embeddings: bool = False
+    ) -> dict:
         """Get graph data for visualization.
 
         If group_id is None, queries ALL available graphs and merges results.
+        Embedding vectors (*_embedding attributes) are left out unless
+        include_embeddings is set.
         """
         try:
             # If no group_id, query all graphs
             if group_id is None:
-                return await self._get_all_graphs_data(limit)
+                return await self._get_all_graphs_data(limit, include_embeddings)
 
             # Single graph query
-            return await self._get_single_graph_data(group_id, limit)
+            return await self._get_single_graph_data(group_id, limit, include_embeddings)
         except Exception as e:
             logger.exception("Error getting graph data")
             return {"success": False, "nodes": [], "edges": [], "error": str(e)}
 
-    async def _get_single_graph_data(self, group_id: str, limit: int) -> dict:
+    async def _get_single_graph_data(
+        self, group_id: str, limit: int, include_embeddings: bool = False
+    ) -> dict:
         """Get data from a single graph using Graphiti methods (DB-neutral)."""
         graphiti = self._get_graphiti(group_id)
 
         # Use Graphiti methods instead of raw Cypher
-        # Use lightweight=True to exclude embedding vectors for better performance
-        entities = await graphiti.get_entities_by_group_id(group_id, limit=limit, lightweight=True)
-        edges = await graphiti.get_edges_by_group_id(group_id, limit=limit, lightweight=True)
+        # lightweight=True lets the driver skip embedding vectors in the query itself
+        # Both queries are independent, so run them concurrently
+        lightweight = not include_embeddings
+        entities, edges = await asyncio.gather(
+            graphiti.get_entities_by_group_id(group_id, limit=limit, lightweight=lightweight),
+            graphiti.get_edges_by_group_id(group_id, limit=limit, lightweight=lightweight),
+        )
 
-        nodes = self._transform_entity_nodes(entities, group_id)
+        nodes = self._transform_entity_nodes(entities, group_id, include_embeddings)
         edges = self._transform_entity_edges(edges, group_id)
 
         return {"success": True, "nodes": nodes, "edges": edges}
 
-    async def _get_all_graphs_data(self, limit: int) -> dict:
+    async def _get_all_graphs_data(self, limit: int, include_embeddings: bool = False) -> dict:
         """Get data from all available graphs and merge results."""
         groups_response = await self.get_group_ids()
         if not groups_response.get("success"):
             return {"success": False, "nodes": [], "edges": [], "error": "Failed to get groups"}
 
-        all_nodes = []
-        all_edges = []
+        all_nodes: list[GraphNode] = []
+        all_edges: list[GraphEdge] = []
         seen_node_ids: set[str] = set()
         seen_edge_ids: set[str] = set()
 
@@ -143,70 +337,98 @@ class GraphitiClient:
 
         per_graph_limit = limit  # Don't divide - fetch full limit from each graph
 
-        for gid in group_ids:
-            try:
-                result = await self._get_single_graph_data(gid, per_graph_limit)
-                if result.get("success"):
-                    for node in result.get("nodes", []):
-                        if node["id"] not in seen_node_ids:
-                            seen_node_ids.add(node["id"])
-                            all_nodes.append(node)
-                    for edge in result.get("edges", []):
-                        if edge["uuid"] not in seen_edge_ids:
-                            seen_edge_ids.add(edge["uuid"])
-                            all_edges.append(edge)
-            except Exception as e:
-                logger.warning(f"Failed to query graph {gid}: {e}")
+        # Query all graphs concurrently; merge in group order so output stays stable
+        results = await asyncio.gather(
+            *(
+                self._get_single_graph_data(gid, per_graph_limit, include_embeddings)
+                for gid in group_ids
+            ),
+            return_exceptions=True,
+        )
+
+        for gid, result in zip(group_ids, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logger.warning(f"Failed to query graph {gid}: {result}")
+                continue
+            if result.get("success"):
+                for node in result.get("nodes", []):
+                    if node["id"] not in seen_node_ids:
+                        seen_node_ids.add(node["id"])
+                        all_nodes.append(node)
+                for edge in result.get("edges", []):
+                    if edge["uuid"] not in seen_edge_ids:
+                        seen_edge_ids.add(edge["uuid"])
+                        all_edges.append(edge)
 
         return {"success": True, "nodes": all_nodes, "edges": all_edges}
 
-    def _transform_entity_nodes(self, entities: list, group_id: str) -> list:
-        """Transform EntityNode objects to visualization format."""
+    def _transform_entity_nodes(
+        self, entities: list, group_id: str, include_embeddings: bool = False
+    ) -> list[GraphNode]:
+        """Transform EntityNode objects to the frontend's visualization format."""
         from graphiti_core.nodes import EntityNode
 
-        nodes = []
+        nodes: list[GraphNode] = []
         for entity in entities:
             if not isinstance(entity, EntityNode):
                 continue
 
-            labels = list(entity.labels) if entity.labels else []
-            if "Entity" in labels:
-                labels = [l for l in labels if l != "Entity"]
+            # Labels repeat across thousands of nodes; intern so each distinct
+            # label is one string object instead of one per row
+            labels = [sys.intern(l) for l in entity.labels or () if l != "Entity"]
+
+            attributes = entity.attributes or {}
+            # Drop any *_embedding attributes the driver still returned. With
+            # lightweight queries there usually are none, so only copy the dict
+            # when a key actually matches (slice compare beats str.endswith here)
+            if (
+                not include_embeddings
+                and attributes
+                and [k for k in attributes if k[-10:] == "_embedding"]
+            ):
+                attributes = {k: v for k, v in attributes.items() if k[-10:] != "_embedding"}
 
             nodes.append({
                 "id": entity.uuid,
-                "uuid": entity.uuid,
                 "name": entity.name,
+                "type": labels[0] if labels else "Entity",
+                "group_id": sys.intern(entity.group_id) if entity.group_id else group_id,
                 "summary": entity.summary or "",
-                "group_id": entity.group_id or group_id,
-                "created_at": entity.created_at.isoformat() if entity.created_at else None,
                 "labels": labels,
-                "type": labels[0] if labels else "Entity",
-                "attributes": entity.attributes or {},
+                "created_at": entity.created_at.isoformat() if entity.created_at else None,
+                "attributes": attributes,
             })
         return nodes
 
-    def _transform_entity_edges(self, edges: list, group_id: str) -> list:
-        """Transform EntityEdge objects to visualization format."""
+    def _transform_entity_edges(self, edges: list, group_id: str) -> list[GraphEdge]:
+        """Transform EntityEdge objects to the frontend's visualization format."""
         from graphiti_core.edges import EntityEdge
 
-        result = []
+        result: list[GraphEdge] = []
         for edge in edges:
             if not isinstance(edge, EntityEdge):
                 continue
 
-            result.append({
-                "uuid": edge.uuid,
+            # Graphiti stores the relationship name in 'name'; type(r) is always RELATES_TO
+            item: GraphEdge = {
                 "source": edge.source_node_uuid,
                 "target": edge.target_node_uuid,
-                "name": edge.name or "",
+                "type": sys.intern(edge.name) if edge.name else "RELATES_TO",
                 "fact": edge.fact or "",
-                "group_id": edge.group_id or group_id,
+                "uuid": edge.uuid,
+                "group_id": sys.intern(edge.group_id) if edge.group_id else group_id,
                 "created_at": edge.created_at.isoformat() if edge.created_at else "",
-                "valid_at": edge.valid_at.isoformat() if edge.valid_at else None,
-                "expired_at": edge.invalid_at.isoformat() if edge.invalid_at else None,
-                "episodes": edge.episodes or [],
-            })
+            }
+            # Omit unset optional fields instead of sending null/[]
+            if edge.valid_at:
+                item["valid_at"] = edge.valid_at.isoformat()
+            if edge.invalid_at:
+                item["expired_at"] = edge.invalid_at.isoformat()
+            if edge.episodes:
+                item["episodes"] = edge.episodes
+            result.append(item)
         return result
 
     async def get_group_ids(self) -> dict:
@@ -214,15 +436,48 @@ class GraphitiClient:
 
         Uses graphiti.get_groups() which delegates to driver.list_groups().
         All 4 drivers (FalkorDB, Neo4j, Kuzu, Neptune) implement this.
+        Concurrent lookups share one call. The list itself is only cached in
+        Redis, so every worker sees invalidations at once.
         """
+        return await self._group_ids_loads.run(self._group_ids_generation, self._load_group_ids)
+
+    async def _load_group_ids(self) -> dict:
+        """Load group IDs, via the shared Redis cache with FalkorDB."""
+        cache = self._get_redis()
+        if cache is not None:
+            try:
+                cached = await cache.get(GROUP_IDS_CACHE_KEY)
+                if cached is not None:
+                    return {"success": True, "group_ids": orjson.loads(cached)}
+            except Exception as e:
+                # Cache is best-effort; fall back to the database
+                logger.debug(f"Group IDs cache read failed: {e}")
+
         try:
             graphiti = self._get_graphiti()
             groups = await graphiti.get_groups()
-            return {"success": True, "group_ids": groups}
         except Exception as e:
             logger.exception("Error getting group IDs")
             return {"success": False, "group_ids": [], "error": str(e)}
 
+        if cache is not None:
+            try:
+                await cache.setex(GROUP_IDS_CACHE_KEY, GROUP_IDS_CACHE_TTL, orjson.dumps(groups))
+            except Exception as e:
+                logger.debug(f"Group IDs cache write failed: {e}")
+        return {"success": True, "group_ids": groups}
+
+    async def invalidate_group_ids(self) -> None:
+        """Drop the cached group ID list after groups were added, removed or renamed."""
+        self._group_ids_generation += 1
+        cache = self._get_redis()
+        if cache is None:
+            return
+        try:
+            await cache.delete(GROUP_IDS_CACHE_KEY)
+        except Exception as e:
+            logger.debug(f"Group IDs cache invalidation failed: {e}")
+
     async def get_graph_stats(self, group_id: str | None = None) -> dict:
         """Get graph statistics."""
         try:
@@ -241,6 +496,96 @@ class GraphitiClient:
             logger.exception("Error getting graph stats")
             return {"success": False, "stats": {}, "error": str(e)}
 
+    # =========================================================================
+    # Detail Serialization
+    # =========================================================================
+
+    @staticmethod
+    def _serialize_node_details(node: Any) -> dict:
+        """Serialize an EntityNode for the details panel."""
+        return {
+            "uuid": node.uuid,
+            "name": node.name,
+            "summary": node.summary,
+            "group_id": node.group_id,
+            "labels": node.labels,
+            "attributes": node.attributes,
+            "created_at": node.created_at.isoformat() if node.created_at else None,
+        }
+
+    @staticmethod
+    def _serialize_edge_details(edge: Any) -> dict:
+        """Serialize an EntityEdge for the details panel."""
+        return {
+            "uuid": edge.uuid,
+            "name": edge.name,
+            "fact": edge.fact,
+            "source_node_uuid": edge.source_node_uuid,
+            "target_node_uuid": edge.target_node_uuid,
+            "group_id": edge.group_id,
+            "episodes": edge.episodes,
+            "attributes": edge.attributes,
+            "created_at": edge.created_at.isoformat() if edge.created_at else None,
+            "valid_at": edge.valid_at.isoformat() if edge.valid_at else None,
+            "invalid_at": edge.invalid_at.isoformat() if edge.invalid_at else None,
+        }
+
+    @staticmethod
+    def _serialize_episode_details(episode: Any) -> dict:
+        """Serialize an EpisodicNode for the details panel."""
+        return {
+            "uuid": episode.uuid,
+            "name": episode.name,
+            "content": episode.content,
+            "source": episode.source.value,
+            "source_description": episode.source_description,
+            "group_id": episode.group_id,
+            "entity_edges": episode.entity_edges,
+            "created_at": episode.created_at.isoformat() if episode.created_at else None,
+            "valid_at": episode.valid_at.isoformat() if episode.valid_at else None,
+        }
+
+    async def lookup_batch(
+        self,
+        node_uuids: list[str] | None = None,
+        edge_uuids: list[str] | None = None,
+        episode_uuids: list[str] | None = None,
+        group_id: str | None = None,
+    ) -> dict:
+        """Fetch several nodes, edges and episodes in one call.
+
+        Each kind is loaded with a single get_by_uuids query, and the three
+        queries run concurrently in a TaskGroup. Unknown UUIDs are simply
+        missing from the result.
+        """
+        from graphiti_core.edges import EntityEdge
+        from graphiti_core.nodes import EntityNode, EpisodicNode
+
+        async def fetch(cls: Any, uuids: list[str] | None) -> list:
+            if not uuids:
+                return []
+            return await cls.get_by_uuids(driver, uuids)
+
+        try:
+            driver = self._get_graphiti(group_id).driver
+            # TaskGroup cancels the remaining queries as soon as one fails
+            async with asyncio.TaskGroup() as tg:
+                nodes = tg.create_task(fetch(EntityNode, node_uuids))
+                edges = tg.create_task(fetch(EntityEdge, edge_uuids))
+                episodes = tg.create_task(fetch(EpisodicNode, episode_uuids))
+            return {
+                "success": True,
+                "nodes": [self._serialize_node_details(n) for n in nodes.result()],
+                "edges": [self._serialize_edge_details(e) for e in edges.result()],
+                "episodes": [self._serialize_episode_details(ep) for ep in episodes.result()],
+            }
+        except Exception as e:
+            logger.exception("Error in batch lookup")
+            # Report the first query failure rather than the group wrapper
+            if isinstance(e, ExceptionGroup):
+                e = e.exceptions[0]
+            return {"success": False, "error": str(e)}
+
     # =========================================================================
     # Node Operations
     # =========================================================================
@@ -250,18 +595,7 @@ class GraphitiClient:
         try:
             graphiti = self._get_graphiti(group_id)
             node = await graphiti.get_entity(uuid)
-            return {
-                "success": True,
-                "node": {
-                    "uuid": node.uuid,
-                    "name": node.name,
-                    "summary": node.summary,
-                    "group_id": node.group_id,
-                    "labels": node.labels,
-                    "attributes": node.attributes,
-                    "created_at": node.created_at.isoformat() if node.created_at else None,
-                },
-            }
+            return {"success": True, "node": self._serialize_node_details(node)}
         except NodeNotFoundError:
             return {"success": False, "error": f"Node {uuid} not found"}
         except Exception as e:
@@ -277,6 +611,21 @@ class GraphitiClient:
         attributes: dict[str, str] | None = None,
     ) -> dict:
         """Create an entity node using Graphiti class (auto-generates embeddings)."""
+        result = await self._create_entity(name, entity_type, summary, group_id, attributes)
+        if result["success"]:
+            # May have created a new group
+            await self.invalidate_group_ids()
+        return result
+
+    async def _create_entity(
+        self,
+        name: str,
+        entity_type: str = "Entity",
+        summary: str = "",
+        group_id: str | None = None,
+        attributes: dict[str, str] | None = None,
+    ) -> dict:
+        """Create an entity node without invalidating the group ID cache."""
         try:
             graphiti = self._get_graphiti(group_id)
             effective_group_id = group_id or self.settings.graphiti_group_id
@@ -299,6 +648,25 @@ class GraphitiClient:
             logger.exception("Error creating entity")
             return {"success": False, "error": str(e)}
 
+    async def bulk_create_entities(self, items: list[dict[str, Any]]) -> list[dict]:
+        """Create many entity nodes directly, BULK_CREATE_CONCURRENCY at a time.
+
+        Each item takes the create_entity_direct keyword arguments. Returns one
+        create_entity_direct result per item, in input order. The group ID
+        cache is cleared once for the whole batch, not once per item.
+        """
+        semaphore = asyncio.Semaphore(BULK_CREATE_CONCURRENCY)
+
+        async def create(item: dict[str, Any]) -> dict:
+            async with semaphore:
+                return await self._create_entity(**item)
+
+        results = await asyncio.gather(*(create(item) for item in items))
+        if any(result["success"] for result in results):
+            # May have created new groups
+            await self.invalidate_group_ids()
+        return results
+
     async def update_entity_node(
         self,
         uuid: str,
@@ -361,22 +729,7 @@ class GraphitiClient:
         try:
             graphiti = self._get_graphiti(group_id)
             edge = await graphiti.get_edge(uuid)
-            return {
-                "success": True,
-                "edge": {
-                    "uuid": edge.uuid,
-                    "name": edge.name,
-                    "fact": edge.fact,
-                    "source_node_uuid": edge.source_node_uuid,
-                    "target_node_uuid": edge.target_node_uuid,
-                    "group_id": edge.group_id,
-                    "episodes": edge.episodes,
-                    "attributes": edge.attributes,
-                    "created_at": edge.created_at.isoformat() if edge.created_at else None,
-                    "valid_at": edge.valid_at.isoformat() if edge.valid_at else None,
-                    "invalid_at": edge.invalid_at.isoformat() if edge.invalid_at else None,
-                },
-            }
+            return {"success": True, "edge": self._serialize_edge_details(edge)}
         except EdgeNotFoundError:
             return {"success": False, "error": f"Edge {uuid} not found"}
         except Exception as e:
@@ -414,6 +767,20 @@ class GraphitiClient:
             logger.exception("Error creating edge")
             return {"success": False, "error": str(e)}
 
+    async def bulk_create_edges(self, items: list[dict[str, Any]]) -> list[dict]:
+        """Create many edges directly, BULK_CREATE_CONCURRENCY at a time.
+
+        Each item takes the create_edge_direct keyword arguments. Returns one
+        create_edge_direct result per item, in input order.
+        """
+        semaphore = asyncio.Semaphore(BULK_CREATE_CONCURRENCY)
+
+        async def create(item: dict[str, Any]) -> dict:
+            async with semaphore:
+                return await self.create_edge_direct(**item)
+
+        return await asyncio.gather(*(create(item) for item in items))
+
     async def update_entity_edge(
         self,
         uuid: str,
@@ -459,20 +826,7 @@ class GraphitiClient:
         try:
             graphiti = self._get_graphiti(group_id)
             episode = await graphiti.get_episode(uuid)
-            return {
-                "success": True,
-                "episode": {
-                    "uuid": episode.uuid,
-                    "name": episode.name,
-                    "content": episode.content,
-                    "source": episode.source.value,
-                    "source_description": episode.source_description,
-                    "group_id": episode.group_id,
-                    "entity_edges": episode.entity_edges,
-                    "created_at": episode.created_at.isoformat() if episode.created_at else None,
-                    "valid_at": episode.valid_at.isoformat() if episode.valid_at else None,
-                },
-            }
+            return {"success": True, "episode": self._serialize_episode_details(episode)}
         except NodeNotFoundError:
             return {"success": False, "error": f"Episode {uuid} not found"}
         except Exception as e:
@@ -546,6 +900,7 @@ class GraphitiClient:
             await graphiti.remove_group(group_id)
             # Clear cached graphiti instance
             self._graphiti_instances.pop(group_id, None)
+            await self.invalidate_group_ids()
             return {"success": True, "deleted": group_id}
         except Exception as e:
             logger.exception("Error deleting graph")
@@ -558,6 +913,7 @@ class GraphitiClient:
             await graphiti.rename_group(group_id, new_name)
             # Clear cached instance for old name
             self._graphiti_instances.pop(group_id, None)
+            await self.invalidate_group_ids()
             return {"success": True, "old_name": group_id, "new_name": new_name}
         except Exception as e:
             logger.exception("Error renaming graph")
@@ -585,52 +941,52 @@ class GraphitiClient:
             return None
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                # Step 1: Initialize MCP session
-                init_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 1,
-                    "method": "initialize",
-                    "params": {
-                        "protocolVersion": "2024-11-05",
-                        "capabilities": {},
-                        "clientInfo": {"name": "graphiti-ui", "version": "1.0"},
-                    },
-                }
-                init_response = await client.post(
-                    mcp_url, json=init_payload, headers=mcp_headers
-                )
-                if init_response.status_code != 200:
-                    return {"success": False, "error": f"MCP init failed: HTTP {init_response.status_code}"}
-
-                session_id = init_response.headers.get("mcp-session-id")
-                if not session_id:
-                    return {"success": False, "error": "MCP server did not return session ID"}
-
-                # Step 2: Call the tool with session ID
-                tool_payload = {
-                    "jsonrpc": "2.0",
-                    "id": 2,
-                    "method": "tools/call",
-                    "params": {
-                        "name": tool_name,
-                        "arguments": arguments,
-                    },
-                }
-                tool_headers = {**mcp_headers, "mcp-session-id": session_id}
-                response = await client.post(
-                    mcp_url, json=tool_payload, headers=tool_headers
-                )
-
-                if response.status_code == 200:
-                    # Parse SSE response
-                    result = parse_sse_response(response.text)
-                    if result is None:
-                        return {"success": False, "error": "Failed to parse MCP response"}
-                    if "error" in result:
-                        return {"success": False, "error": result["error"]}
-                    return {"success": True, "data": result.get("result", {})}
-                return {"success": False, "error": f"HTTP {response.status_code}"}
+            client = self._get_http_client()
+            # Step 1: Initialize MCP session
+            init_payload = {
+                "jsonrpc": "2.0",
+                "id": 1,
+                "method": "initialize",
+                "params": {
+                    "protocolVersion": "2024-11-05",
+                    "capabilities": {},
+                    "clientInfo": {"name": "graphiti-ui", "version": "1.0"},
+                },
+            }
+            init_response = await client.post(
+                mcp_url, json=init_payload, headers=mcp_headers
+            )
+            if init_response.status_code != 200:
+                return {"success": False, "error": f"MCP init failed: HTTP {init_response.status_code}"}
+
+            session_id = init_response.headers.get("mcp-session-id")
+            if not session_id:
+                return {"success": False, "error": "MCP server did not return session ID"}
+
+            # Step 2: Call the tool with session ID
+            tool_payload = {
+                "jsonrpc": "2.0",
+                "id": 2,
+                "method": "tools/call",
+                "params": {
+                    "name": tool_name,
+                    "arguments": arguments,
+                },
+            }
+            tool_headers = {**mcp_headers, "mcp-session-id": session_id}
+            response = await client.post(
+                mcp_url, json=tool_payload, headers=tool_headers
+            )
+
+            if response.status_code == 200:
+                # Parse SSE response
+                result = parse_sse_response(response.text)
+                if result is None:
+                    return {"success": False, "error": "Failed to parse MCP response"}
+                if "error" in result:
+                    return {"success": False, "error": result["error"]}
+                return {"success": True, "data": result.get("result", {})}
+            return {"success": False, "error": f"HTTP {response.status_code}"}
 
         except Exception as e:
             return {"success": False, "error": str(e)}
@@ -706,39 +1062,11 @@ class GraphitiClient:
     # Query Execution
     # =========================================================================
 
-    def _serialize_value(self, value: Any) -> Any:
-        """Serialize a value for JSON response."""
-        if value is None:
-            return None
-        # FalkorDB Node
-        if hasattr(value, 'properties') and hasattr(value, 'labels'):
-            return {
-                'type': 'node',
-                'labels': list(value.labels) if value.labels else [],
-                'properties': dict(value.properties) if value.properties else {},
-            }
-        # FalkorDB Edge/Relationship
-        if hasattr(value, 'properties') and hasattr(value, 'relation'):
-            return {
-                'type': 'edge',
-                'relation': value.relation,
-                'properties': dict(value.properties) if value.properties else {},
-            }
-        # Lists
-        if isinstance(value, list):
-            return [self._serialize_value(v) for v in value]
-        # Dicts
-        if isinstance(value, dict):
-            return {k: self._serialize_value(v) for k, v in value.items()}
-        # Primitives
-        return value
-
     async def execute_query(self, query: str, group_id: str | None = None) -> dict:
         """Execute a read-only Cypher query."""
         try:
             # Basic safety check - only allow read queries
-            query_upper = query.strip().upper()
-            if any(kw in query_upper for kw in ["DELETE", "REMOVE", "SET", "CREATE", "MERGE"]):
+            if is_write_query(query):
                 return {"success": False, "error": "Only read queries are allowed"}
 
             graphiti = self._get_graphiti(group_id)
@@ -746,7 +1074,7 @@ class GraphitiClient:
 
             # Serialize FalkorDB objects to JSON-safe dicts
             serialized_records = [
-                {k: self._serialize_value(v) for k, v in record.items()}
+                {k: _serialize_value(v) for k, v in record.items()}
                 for record in records
             ]
 
@@ -0,0 +1,145 @@
+"""Shared fixtures: temp-dir settings and a test client with a fake graph."""
+
+from collections.abc import Iterator
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import pytest
+
+from src.config import Settings, get_settings
+from src.services import config_service, credentials_service
+
+if TYPE_CHECKING:
+    from fastapi.testclient import TestClient
+
+
+@pytest.fixture
+def settings(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Settings]:
+    """Settings whose config.yaml and credentials.yaml live in tmp_path."""
+    monkeypatch.setenv("CONFIG_PATH", str(tmp_path / "config.yaml"))
+    monkeypatch.setenv("ADMIN_USERNAME", "admin")
+    caches = (
+        get_settings,
+        config_service.get_config_path,
+        credentials_service.get_credentials_path,
+    )
+    for cache in caches:
+        cache.cache_clear()
+    monkeypatch.setattr(config_service, "_config_cache", None)
+    monkeypatch.setattr(credentials_service, "_credentials_cache", None)
+    credentials_service._verified_passwords.invalidate()
+
+    yield get_settings()
+
+    for cache in caches:
+        cache.cache_clear()
+    credentials_service._verified_passwords.invalidate()
+
+
+class FakeGraphitiClient:
+    """GraphitiClient stand-in for route tests: in-memory graph, call counts."""
+
+    def __init__(self) -> None:
+        self.nodes: list[dict] = []
+        self.edges: list[dict] = []
+        self.calls: dict[str, int] = {}
+
+    def _count(self, name: str) -> None:
+        self.calls[name] = self.calls.get(name, 0) + 1
+
+    def add_nodes(self, count: int, group_id: str = "main") -> None:
+        start = len(self.nodes)
+        self.nodes.extend(
+            {
+                "id": f"{i:08x}-0000-4000-8000-000000000000",
+                "name": f"Node {i}",
+                "type": "Entity",
+                "group_id": group_id,
+                "summary": "",
+                "labels": [],
+                "created_at": None,
+                "attributes": {},
+            }
+            for i in range(start, start + count)
+        )
+
+    async def get_graph_data(self, limit: int = 500, group_id: str | None = None) -> dict:
+        self._count("get_graph_data")
+        # Fresh dicts per call, like the real client (the msgpack path mutates them)
+        nodes = [dict(n) for n in self.nodes if group_id is None or n["group_id"] == group_id]
+        return {
+            "success": True,
+            "nodes": nodes[:limit],
+            "edges": [dict(e) for e in self.edges],
+            "labels": [],
+            "stats": {"node_count": len(nodes), "edge_count": len(self.edges)},
+        }
+
+    async def get_group_ids(self) -> dict:
+        self._count("get_group_ids")
+        return {"success": True, "group_ids": sorted({n["group_id"] for n in self.nodes})}
+
+    async def get_graph_stats(self, group_id: str | None = None) -> dict:
+        self._count("get_graph_stats")
+        return {"success": True, "stats": {"node_count": len(self.nodes)}}
+
+    async def execute_query(self, query: str, group_id: str | None = None) -> dict:
+        self._count("execute_query")
+        rows = [{"name": n["name"]} for n in self.nodes if n["group_id"] == group_id]
+        return {"success": True, "results": rows, "count": len(rows)}
+
+    async def create_entity_direct(self, name: str, group_id: str | None = None, **_: object) -> dict:
+        self._count("create_entity_direct")
+        self.add_nodes(1, group_id or "main")
+        self.nodes[-1]["name"] = name
+        return {"success": True, "uuid": self.nodes[-1]["id"], "name": name}
+
+    async def bulk_create_entities(self, items: list[dict]) -> list[dict]:
+        self._count("bulk_create_entities")
+        results = []
+        for item in items:
+            if not item["name"]:
+                results.append({"success": False, "error": "name is required"})
+                continue
+            self.add_nodes(1, item["group_id"])
+            results.append({"success": True, "uuid": self.nodes[-1]["id"]})
+        return results
+
+    async def bulk_create_edges(self, items: list[dict]) -> list[dict]:
+        self._count("bulk_create_edges")
+        results = []
+        for index, item in enumerate(items):
+            uuid = f"{index:08x}-0000-4000-8000-00000000e000"
+            self.edges.append({"source": item["source_uuid"], "target": item["target_uuid"], "uuid": uuid})
+            results.append({"success": True, "uuid": uuid})
+        return results
+
+    async def get_node_details(self, uuid: str, group_id: str | None = None) -> dict:
+        self._count("get_node_details")
+        return {"success": False, "error": f"Node {uuid} not found"}
+
+
+@pytest.fixture
+def graphiti() -> FakeGraphitiClient:
+    return FakeGraphitiClient()
+
+
+@pytest.fixture
+def api(graphiti: FakeGraphitiClient) -> Iterator["TestClient"]:
+    """TestClient for the /api routes, logged in, backed by the fake client."""
+    from fastapi import FastAPI
+    from fastapi.testclient import TestClient
+
+    from src.api import router
+    from src.api.graph_api import invalidate_graph_cache
+    from src.auth.dependencies import get_current_user
+
+    app = FastAPI()
+    app.include_router(router, prefix="/api")
+    app.state.graphiti_client = graphiti
+    app.dependency_overrides[get_current_user] = lambda: {"username": "admin"}
+
+    invalidate_graph_cache()
+    with TestClient(app) as client:
+        yield client
+    invalidate_graph_cache()
@@ -0,0 +1,73 @@
+"""Tests for API key storage and validation."""
+
+from pathlib import Path
+
+import pytest
+
+from src.services import api_key_service
+from src.services.api_key_service import (
+    create_api_key,
+    delete_api_key,
+    list_api_keys,
+    validate_api_key,
+)
+
+
+@pytest.fixture(autouse=True)
+def keys_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Keep api_keys.json and the module's caches per test."""
+    path = tmp_path / "data" / "api_keys.json"
+    monkeypatch.setattr(api_key_service, "API_KEYS_FILE", path)
+    monkeypatch.setattr(api_key_service, "_key_index", {})
+    monkeypatch.setattr(api_key_service, "_key_index_mtime", None)
+    monkeypatch.setattr(api_key_service, "_last_used_written", {})
+    return path
+
+
+def test_created_key_validates() -> None:
+    key = create_api_key("ci")["key"]
+
+    assert validate_api_key(key)
+    assert not validate_api_key(key[:-1] + ("a" if key[-1] != "a" else "b"))
+    assert not validate_api_key("gk_unknownprefix")
+    assert not validate_api_key("")
+
+
+def test_deleted_key_stops_validating_immediately() -> None:
+    key = create_api_key("ci")["key"]
+    assert validate_api_key(key)
+
+    # Same mtime tick as the create; the index must still be rebuilt
+    assert delete_api_key(key[:12])
+    assert not validate_api_key(key)
+
+
+def test_new_key_validates_after_index_was_built() -> None:
+    first = create_api_key("one")["key"]
+    assert validate_api_key(first)
+
+    second = create_api_key("two")["key"]
+    assert validate_api_key(second)
+
+
+def test_unknown_prefix_still_compares(monkeypatch: pytest.MonkeyPatch) -> None:
+    create_api_key("ci")
+    compared: list[bytes] = []
+    compare = api_key_service.hmac.compare_digest
+
+    def recording(a: bytes, b: bytes) -> bool:
+        compared.append(a)
+        return compare(a, b)
+
+    monkeypatch.setattr(api_key_service.hmac, "compare_digest", recording)
+
+    assert not validate_api_key("gk_doesnotexist_at_all")
+    assert compared == [api_key_service._DUMMY_KEY.encode()]
+
+
+def test_last_used_is_recorded() -> None:
+    key = create_api_key("ci")["key"]
+    assert list_api_keys()[0]["last_used"] is None
+
+    assert validate_api_key(key)
+    assert list_api_keys()[0]["last_used"] is not None
@@ -0,0 +1,99 @@
+"""Tests for TTLCache and SingleFlight."""
+
+import asyncio
+
+import pytest
+
+from src.services import cache_service
+from src.services.cache_service import SingleFlight, TTLCache
+
+
+def test_ttl_cache_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    now = [100.0]
+    monkeypatch.setattr(cache_service.time, "monotonic", lambda: now[0])
+    cache: TTLCache[str, int] = TTLCache(ttl=5.0)
+
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    now[0] += 5.0
+    assert cache.get("a") is None
+
+
+def test_ttl_cache_evicts_oldest_when_full() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl=60.0, maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.set("c", 3)
+
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+    assert cache.get("c") == 3
+
+
+def test_invalidate_with_predicate() -> None:
+    cache: TTLCache[tuple[str], int] = TTLCache(ttl=60.0)
+    cache.set(("a",), 1)
+    cache.set(("b",), 2)
+
+    cache.invalidate(lambda key: key[0] == "a")
+
+    assert cache.get(("a",)) is None
+    assert cache.get(("b",)) == 2
+
+
+def test_stale_generation_is_not_stored() -> None:
+    cache: TTLCache[str, int] = TTLCache(ttl=60.0)
+    generation = cache.generation
+
+    # An edit lands while a load that started before it is still running
+    cache.invalidate()
+    cache.set("a", 1, generation)
+    assert cache.get("a") is None
+
+    cache.set("a", 2, cache.generation)
+    assert cache.get("a") == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(flight.run("k", fetch) for _ in range(5)))
+
+    assert results == [42] * 5
+    assert calls == 1
+    # Finished calls are forgotten; the next run fetches again
+    assert await flight.run("k", fetch) == 42
+    assert calls == 2
+
+
+@pytest.mark.asyncio
+async def test_single_flight_survives_cancelled_caller() -> None:
+    flight: SingleFlight[str, int] = SingleFlight()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch() -> int:
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return 7
+
+    first = asyncio.create_task(flight.run("k", fetch))
+    second = asyncio.create_task(flight.run("k", fetch))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await first
+
+    release.set()
+    assert await second == 7
+    assert calls == 1
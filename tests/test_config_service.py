@@ -0,0 +1,31 @@
+"""Tests for config.yaml reading and its mtime cache."""
+
+import os
+
+from src.config import Settings
+from src.services.config_service import get_config_path, read_config, write_config
+
+
+def test_missing_config_reads_empty(settings: Settings) -> None:
+    assert read_config() == {}
+
+
+def test_config_cached_until_written(settings: Settings) -> None:
+    write_config({"llm": {"provider": "openai"}})
+    first = read_config()
+    assert read_config() is first
+
+    write_config({"llm": {"provider": "ollama"}})
+    assert read_config()["llm"]["provider"] == "ollama"
+
+
+def test_external_edit_reloaded_on_mtime_change(settings: Settings) -> None:
+    write_config({"llm": {"provider": "openai"}})
+    assert read_config()["llm"]["provider"] == "openai"
+
+    path = get_config_path()
+    path.write_text("llm:\n  provider: anthropic\n")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert read_config()["llm"]["provider"] == "anthropic"
@@ -0,0 +1,90 @@
+"""Tests for admin credential storage and login verification."""
+
+import bcrypt
+import pytest
+
+from src.config import Settings
+from src.services import credentials_service
+from src.services.credentials_service import (
+    read_credentials,
+    set_admin_password,
+    verify_admin_login,
+)
+
+
+@pytest.fixture
+def check_calls(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record every full password check (argon2/bcrypt) made during a test."""
+    calls: list[str] = []
+    check_password = credentials_service._check_password
+
+    def counting(password: str, password_hash: str) -> bool:
+        calls.append(password)
+        return check_password(password, password_hash)
+
+    monkeypatch.setattr(credentials_service, "_check_password", counting)
+    return calls
+
+
+def test_login_with_current_hash(settings: Settings) -> None:
+    set_admin_password("correct horse")
+
+    assert verify_admin_login("admin", "correct horse")
+    assert not verify_admin_login("admin", "wrong")
+    assert not verify_admin_login("someone", "correct horse")
+
+
+def test_legacy_bcrypt_hash_is_upgraded_on_login(settings: Settings) -> None:
+    legacy = bcrypt.hashpw(b"correct horse", bcrypt.gensalt(rounds=4)).decode()
+    credentials_service._store_password_hash(legacy)
+
+    assert not verify_admin_login("admin", "wrong")
+    assert read_credentials()["admin"]["password_hash"] == legacy
+
+    assert verify_admin_login("admin", "correct horse")
+    upgraded = read_credentials()["admin"]["password_hash"]
+    assert upgraded.startswith("$argon2id$")
+    assert verify_admin_login("admin", "correct horse")
+
+
+def test_repeat_login_skips_full_verify(settings: Settings, check_calls: list[str]) -> None:
+    set_admin_password("correct horse")
+
+    assert verify_admin_login("admin", "correct horse")
+    assert verify_admin_login("admin", "correct horse")
+    assert len(check_calls) == 1
+
+
+def test_wrong_username_always_does_full_verify(
+    settings: Settings, check_calls: list[str]
+) -> None:
+    set_admin_password("correct horse")
+    assert verify_admin_login("admin", "correct horse")
+    check_calls.clear()
+
+    # The right password is cached for "admin", but must not short-cut here
+    assert not verify_admin_login("someone", "correct horse")
+    assert not verify_admin_login("someone", "correct horse")
+    assert check_calls == ["correct horse", "correct horse"]
+
+
+def test_password_change_drops_verified_logins(
+    settings: Settings, check_calls: list[str]
+) -> None:
+    set_admin_password("correct horse")
+    assert verify_admin_login("admin", "correct horse")
+
+    set_admin_password("battery staple")
+    assert not verify_admin_login("admin", "correct horse")
+    assert verify_admin_login("admin", "battery staple")
+
+
+def test_read_credentials_cached_until_written(settings: Settings) -> None:
+    set_admin_password("correct horse")
+    first = read_credentials()
+    assert read_credentials() is first
+
+    set_admin_password("battery staple")
+    second = read_credentials()
+    assert second is not first
+    assert second["admin"]["password_hash"] != first["admin"]["password_hash"]
@@ -0,0 +1,30 @@
+"""Tests for graph driver construction."""
+
+import pytest
+
+pytest.importorskip("redis")
+
+from src.config import Settings  # noqa: E402
+from src.services.driver_factory import (  # noqa: E402
+    FALKORDB_MAX_CONNECTIONS,
+    FALKORDB_POOL_TIMEOUT,
+    create_falkordb_pool,
+)
+
+
+def test_falkordb_pool_decodes_responses() -> None:
+    settings = Settings(falkordb_host="db", falkordb_port=6380, falkordb_password="pw")
+    pool = create_falkordb_pool(settings)
+
+    assert pool.connection_kwargs["decode_responses"] is True
+    assert pool.connection_kwargs["host"] == "db"
+    assert pool.connection_kwargs["port"] == 6380
+    assert pool.connection_kwargs["password"] == "pw"
+    assert pool.max_connections == FALKORDB_MAX_CONNECTIONS
+    assert pool.timeout == FALKORDB_POOL_TIMEOUT
+
+
+def test_falkordb_pool_without_password() -> None:
+    pool = create_falkordb_pool(Settings(falkordb_password=""))
+
+    assert pool.connection_kwargs["password"] is None
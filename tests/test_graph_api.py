@@ -0,0 +1,163 @@
+"""Tests for the /api/graph routes: caching, conditional requests, bulk edits."""
+
+import pytest
+
+pytest.importorskip("graphiti_core")
+
+from src.api.graph_api import GRAPH_DATA_STREAM_THRESHOLD  # noqa: E402
+
+
+def test_data_etag_304(api, graphiti) -> None:
+    graphiti.add_nodes(3)
+
+    first = api.get("/api/graph/data")
+    assert first.status_code == 200
+    etag = first.headers["etag"]
+
+    again = api.get("/api/graph/data", headers={"If-None-Match": etag})
+    assert again.status_code == 304
+    assert again.content == b""
+
+
+def test_streamed_data_has_etag_and_304(api, graphiti) -> None:
+    graphiti.add_nodes(GRAPH_DATA_STREAM_THRESHOLD + 1)
+
+    first = api.get("/api/graph/data", params={"limit": GRAPH_DATA_STREAM_THRESHOLD + 1})
+    assert first.status_code == 200
+    assert len(first.json()["nodes"]) == GRAPH_DATA_STREAM_THRESHOLD + 1
+    etag = first.headers["etag"]
+
+    again = api.get(
+        "/api/graph/data",
+        params={"limit": GRAPH_DATA_STREAM_THRESHOLD + 1},
+        headers={"If-None-Match": etag},
+    )
+    assert again.status_code == 304
+    assert graphiti.calls["get_graph_data"] == 1
+
+
+def test_streamed_etag_changes_after_edit(api, graphiti) -> None:
+    graphiti.add_nodes(GRAPH_DATA_STREAM_THRESHOLD + 1)
+    params = {"limit": GRAPH_DATA_STREAM_THRESHOLD + 5}
+    etag = api.get("/api/graph/data", params=params).headers["etag"]
+
+    created = api.post("/api/graph/node/direct", json={"name": "New", "group_id": "main"})
+    assert created.json()["success"]
+
+    after = api.get("/api/graph/data", params=params, headers={"If-None-Match": etag})
+    assert after.status_code == 200
+    assert after.headers["etag"] != etag
+    assert len(after.json()["nodes"]) == GRAPH_DATA_STREAM_THRESHOLD + 2
+
+
+@pytest.mark.parametrize("kind", ["node", "edge", "episode"])
+def test_malformed_uuid_is_400(api, graphiti, kind: str) -> None:
+    response = api.get(f"/api/graph/{kind}/not-a-uuid")
+
+    assert response.status_code == 400
+    assert "Invalid UUID" in response.json()["detail"]
+    assert not graphiti.calls
+
+
+def test_well_formed_uuid_reaches_client(api, graphiti) -> None:
+    response = api.get("/api/graph/node/00000000-0000-4000-8000-000000000000")
+
+    assert response.status_code == 200
+    assert response.json()["success"] is False
+    assert graphiti.calls["get_node_details"] == 1
+
+
+def test_data_reflects_edit_within_cache_ttl(api, graphiti) -> None:
+    graphiti.add_nodes(2)
+    assert len(api.get("/api/graph/data").json()["nodes"]) == 2
+    assert len(api.get("/api/graph/data").json()["nodes"]) == 2
+    assert graphiti.calls["get_graph_data"] == 1
+
+    api.post("/api/graph/node/direct", json={"name": "New", "group_id": "main"})
+
+    assert len(api.get("/api/graph/data").json()["nodes"]) == 3
+    assert graphiti.calls["get_graph_data"] == 2
+
+
+def test_query_results_cleared_by_edit(api, graphiti) -> None:
+    graphiti.add_nodes(1)
+    query = {"query": "MATCH (n) RETURN n.name", "graph_id": "main"}
+    assert api.post("/api/query", json=query).json()["results"][0]["count"] == 1
+    assert api.post("/api/query", json=query).json()["results"][0]["count"] == 1
+    assert graphiti.calls["execute_query"] == 1
+
+    api.post("/api/graph/node/direct", json={"name": "New", "group_id": "main"})
+
+    assert api.post("/api/query", json=query).json()["results"][0]["count"] == 2
+
+
+def test_write_query_rejected(api, graphiti) -> None:
+    response = api.post("/api/query", json={"query": "MATCH (n) DETACH DELETE n"})
+
+    assert response.json()["success"] is False
+    assert "execute_query" not in graphiti.calls
+
+
+def test_msgpack_negotiation(api, graphiti) -> None:
+    ormsgpack = pytest.importorskip("ormsgpack")
+    graphiti.add_nodes(2)
+
+    packed = api.get("/api/graph/data", headers={"Accept": "application/msgpack"})
+    assert packed.headers["content-type"] == "application/msgpack"
+    assert packed.headers["vary"] == "Accept"
+    payload = ormsgpack.unpackb(packed.content)
+    assert [len(node["id"]) for node in payload["nodes"]] == [16, 16]
+
+    plain = api.get("/api/graph/data")
+    assert plain.headers["content-type"] == "application/json"
+    assert plain.json()["nodes"][0]["id"] == graphiti.nodes[0]["id"]
+    assert packed.headers["etag"] != plain.headers["etag"]
+
+
+def test_groups_etag_304(api, graphiti) -> None:
+    graphiti.add_nodes(1, group_id="alpha")
+    first = api.get("/api/graph/groups")
+    assert first.json()["group_ids"] == ["alpha"]
+
+    again = api.get("/api/graph/groups", headers={"If-None-Match": first.headers["etag"]})
+    assert again.status_code == 304
+
+
+def test_bulk_create_nodes(api, graphiti) -> None:
+    response = api.post(
+        "/api/graph/node/direct/bulk",
+        json={
+            "nodes": [
+                {"name": "A", "group_id": "main", "temp_id": "a"},
+                {"name": "", "group_id": "main"},
+                {"name": "C", "group_id": "other"},
+            ]
+        },
+    )
+    body = response.json()
+
+    assert body["success"] is False
+    assert set(body["created"]) == {"a", "2"}
+    assert body["errors"] == {"1": "name is required"}
+    assert graphiti.calls["bulk_create_entities"] == 1
+    assert len(api.get("/api/graph/data").json()["nodes"]) == 2
+
+
+def test_bulk_create_edges(api, graphiti) -> None:
+    graphiti.add_nodes(2)
+    source, target = (n["id"] for n in graphiti.nodes)
+    edge = {"source_uuid": source, "target_uuid": target, "relationship_type": "KNOWS"}
+
+    response = api.post(
+        "/api/graph/edge/direct/bulk",
+        json={"edges": [{**edge, "group_id": "main", "temp_id": "e1"}, {**edge, "group_id": "main"}]},
+    )
+    body = response.json()
+
+    assert body["success"] is True
+    assert set(body["created"]) == {"e1", "1"}
+    assert len(api.get("/api/graph/data").json()["edges"]) == 2
+
+
+def test_bulk_create_rejects_empty_batch(api) -> None:
+    assert api.post("/api/graph/node/direct/bulk", json={"nodes": []}).status_code == 422
@@ -0,0 +1,71 @@
+"""Tests for the shared group ID cache in GraphitiClient."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("graphiti_core")
+
+from src.config import Settings  # noqa: E402
+from src.services.graphiti_service import GraphitiClient  # noqa: E402
+
+
+class FakeRedis:
+    """In-memory stand-in for the FalkorDB Redis shared by all workers."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        return self.data.get(key)
+
+    async def setex(self, key: str, ttl: int, value: bytes) -> None:
+        self.data[key] = value
+
+    async def delete(self, key: str) -> None:
+        self.data.pop(key, None)
+
+
+class FakeGraphiti:
+    def __init__(self, groups: list[str]) -> None:
+        self.groups = groups
+        self.calls = 0
+
+    async def get_groups(self) -> list[str]:
+        self.calls += 1
+        await asyncio.sleep(0)
+        return list(self.groups)
+
+
+def _worker(shared: FakeRedis, graphiti: FakeGraphiti) -> GraphitiClient:
+    client = GraphitiClient()
+    client._redis = shared
+    client._get_graphiti = lambda group_id=None: graphiti
+    return client
+
+
+@pytest.mark.asyncio
+async def test_concurrent_lookups_share_one_load(settings: Settings) -> None:
+    graphiti = FakeGraphiti(["a", "b"])
+    client = _worker(FakeRedis(), graphiti)
+
+    results = await asyncio.gather(*(client.get_group_ids() for _ in range(5)))
+
+    assert all(r == {"success": True, "group_ids": ["a", "b"]} for r in results)
+    assert graphiti.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_invalidation_is_seen_by_other_workers(settings: Settings) -> None:
+    shared = FakeRedis()
+    graphiti = FakeGraphiti(["a", "b"])
+    worker_a = _worker(shared, graphiti)
+    worker_b = _worker(shared, graphiti)
+
+    assert (await worker_b.get_group_ids())["group_ids"] == ["a", "b"]
+
+    # Worker A deletes graph "b"; worker B must not keep serving it
+    graphiti.groups = ["a"]
+    await worker_a.invalidate_group_ids()
+
+    assert (await worker_b.get_group_ids())["group_ids"] == ["a"]
@@ -0,0 +1,87 @@
+"""Tests for the MCP proxy: streamed SSE replies reach the client unbuffered."""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import pytest
+
+pytest.importorskip("graphiti_core")
+
+import httpx  # noqa: E402
+
+from src.api import mcp_proxy  # noqa: E402
+from src.main import create_app  # noqa: E402
+
+
+@pytest.mark.asyncio
+async def test_sse_chunks_arrive_unbuffered(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(mcp_proxy, "validate_api_key", lambda key: key == "gk_test")
+    release = asyncio.Event()
+
+    async def upstream_events() -> AsyncIterator[bytes]:
+        yield b"event: message\ndata: first\n\n"
+        # The second event is only sent once the client has seen the first
+        await release.wait()
+        yield b"event: message\ndata: second\n\n"
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, content=upstream_events()
+        )
+
+    app = create_app()
+    app.state.mcp_proxy_client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+
+    messages: list[dict] = []
+    first_event = asyncio.Event()
+    disconnected = asyncio.Event()
+    requested = False
+
+    async def receive() -> dict:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+        if b"first" in message.get("body", b""):
+            first_event.set()
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": "/mcp/",
+        "raw_path": b"/mcp/",
+        "root_path": "",
+        "query_string": b"",
+        "headers": [
+            (b"authorization", b"Bearer gk_test"),
+            (b"accept", b"text/event-stream"),
+            (b"accept-encoding", b"gzip"),
+            (b"content-length", b"0"),
+        ],
+        "client": ("test", 1),
+        "server": ("test", 80),
+    }
+    task = asyncio.create_task(app(scope, receive, send))
+    try:
+        await asyncio.wait_for(first_event.wait(), timeout=2)
+
+        start = messages[0]
+        assert start["type"] == "http.response.start"
+        assert (b"content-encoding", b"gzip") not in start["headers"]
+
+        release.set()
+        await asyncio.wait_for(task, timeout=2)
+    finally:
+        disconnected.set()
+        await app.state.mcp_proxy_client.aclose()
+
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    assert body == b"event: message\ndata: first\n\nevent: message\ndata: second\n\n"
@@ -0,0 +1,48 @@
+"""Tests for the read-only guard on the Cypher query endpoint."""
+
+import pytest
+
+pytest.importorskip("graphiti_core")
+
+from src.services.graphiti_service import is_write_query  # noqa: E402
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "MATCH (n) DETACH DELETE n",
+        "CREATE (n:Entity {name: 'x'})",
+        "MATCH (n) SET n.name = 'x'",
+        "MATCH (n) REMOVE n.name",
+        "MERGE (n:Entity {name: 'x'})",
+        "match (n) delete n",
+        # Writes hidden in procedure arguments
+        "CALL apoc.cypher.doIt('CREATE (n) RETURN n', {})",
+        "CALL apoc.periodic.iterate('MATCH (n) RETURN n','DETACH DELETE n',{})",
+        # Write procedures without word boundaries around the keyword
+        "CALL db.idx.fulltext.createNodeIndex('Entity', 'name')",
+        "CALL db.idx.fulltext.drop('Entity')",
+        "CALL db.idx.vector.createNodeIndex('Entity', 'embedding', 768, 'cosine')",
+        # Cypher assembled from strings the keyword check can't see
+        "CALL apoc.cypher.doIt('CRE' + 'ATE (n) RETURN n', {})",
+        "CALL apoc.periodic.commit('MATCH (n) WITH n LIMIT 1 RETURN count(*)', {})",
+    ],
+)
+def test_write_queries_rejected(query: str) -> None:
+    assert is_write_query(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "MATCH (n) RETURN n LIMIT 10",
+        "MATCH (n:Entity)-[r]->(m) RETURN n.name, type(r), m.name",
+        "MATCH (n) WHERE n.name = $name RETURN count(n)",
+        "MATCH (n) RETURN n.created_at ORDER BY n.created_at",
+        "MATCH (n) RETURN n SKIP 10 LIMIT 10",
+        "MATCH (n) RETURN n.offset, n.dataset, n.reset, n.dropdown",
+        "CALL db.labels() YIELD label RETURN label",
+    ],
+)
+def test_read_queries_allowed(query: str) -> None:
+    assert not is_write_query(query)